@@ -2,13 +2,50 @@ import sys
 import json
 import ast
 import os
+import time
+import mmap
+import struct
+import argparse
+import gzip
+import hashlib
+import re
+import math
+import statistics
+import itertools
+import csv
+import asyncio
+import socket
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from array import array
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget,
                              QVBoxLayout, QPushButton, QLineEdit, QHBoxLayout,
                              QMessageBox, QLabel, QStackedWidget, QFileDialog,
                              QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
-                             QGroupBox, QDialog, QDialogButtonBox)
+                             QGroupBox, QDialog, QDialogButtonBox, QListWidget,
+                             QCheckBox, QAbstractItemView, QComboBox, QTabBar, QTableView)
 from PyQt5.QtGui import  QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (Qt, QObject, QTimer, QFileSystemWatcher, pyqtSignal,
+                          QAbstractTableModel, QModelIndex)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 
 class StyleConfig:
@@ -21,20 +58,55 @@ class StyleConfig:
             'type_bg': QColor(30, 136, 229),
             'item_bg': QColor(255, 220, 200),
             'val_bg': QColor(255, 240, 230),
-            'header': '#1E88E5'
+            'header': '#1E88E5',
+            'fg': QColor(0, 100, 200),
+            'legend': "■ COLD (Left Column)"
         },
         'warm': {
             'type_bg': QColor(255, 107, 53),
             'item_bg': QColor(255, 235, 205),
             'val_bg': QColor(255, 245, 235),
-            'header': '#FF6B35'
+            'header': '#FF6B35',
+            'fg': QColor(200, 50, 0),
+            'legend': "■ WARM (Right Column)"
+        },
+        'LP': {
+            'type_bg': QColor(67, 160, 71),
+            'item_bg': QColor(220, 240, 220),
+            'val_bg': QColor(235, 248, 235),
+            'header': '#43A047',
+            'fg': QColor(30, 120, 40),
+            'legend': "■ LP (Extra Column)"
         }
     }
     
+    DEFAULT_FAMILY_COLORS = {
+        'type_bg': QColor(108, 117, 125),
+        'item_bg': QColor(230, 230, 230),
+        'val_bg': QColor(245, 245, 245),
+        'header': '#6C757D',
+        'fg': QColor(60, 60, 60),
+        'legend': "■ {}"
+    }
+    
+    FAMILY_ICONS = {'cold': "❄️", 'warm': "🔥", 'LP': "🔋"}
+    
     @staticmethod
     def get_button_style(size, color):
         return StyleConfig.BTN_BASE.format(size, color)
     
+    @staticmethod
+    def family_colors(family):
+        return StyleConfig.COLORS.get(family, StyleConfig.DEFAULT_FAMILY_COLORS)
+    
+    @staticmethod
+    def family_icon(family):
+        return StyleConfig.FAMILY_ICONS.get(family, "⚙️")
+    
+    @staticmethod
+    def family_label(family):
+        return family.capitalize() if family.islower() else family
+    
     @staticmethod
     def get_input_style(border_width, border_color, highlight=False):
         style = StyleConfig.INPUT_STYLE.format(border_width, border_color)
@@ -43,36 +115,237 @@ class StyleConfig:
         return style
 
 
+class ContentPool:
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def intern(self, values):
+        key = tuple(values)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = [key, 0]
+            entry[1] += 1
+        return entry[0]
+
+    def release(self, keys):
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is None:
+                    continue
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self.entries[key]
+
+    @staticmethod
+    def writable(container, key):
+        values = container[key]
+        if isinstance(values, tuple):
+            values = list(values)
+            container[key] = values
+        return values
+
+
+
 class ModuleData:
     
-    def __init__(self):
-        self.cold_modules = {}
-        self.warm_modules = {}
-        self.cold_ports = {}
-        self.warm_ports = {}
+    FAMILIES = ["cold", "warm", "LP"]
+    REQUIRED_FAMILIES = ["cold", "warm"]
+    
+    def __init__(self, pool=None, families=None):
+        self.pool = pool if pool is not None else ContentPool()
+        self.families = []
+        self.modules = {}
+        self.ports = {}
+        self.params = {}
+        for family in families if families is not None else ModuleData.FAMILIES:
+            self.add_family(family)
         self.modified_data = {}
+        self.pixel_edits = {}
+        self.unsaved = set()
         self.serial_number = None
         self.file_saved = None
         self.base_module_path = None
-        
+        self.load_stats = LoadStats()
+        self.file_signatures = {}
+        self.baseline_params = {}
+        self.conflicts = {}
+        self.connectivity = ConnectivityIndex()
+        self.pooled = {}
+        
+    def add_family(self, family):
+        if family not in self.families:
+            self.families.append(family)
+            self.modules[family] = {}
+            self.ports[family] = {}
+            self.params[family] = ParameterStore()
+    
+    def loaded_families(self):
+        return [family for family in self.families if self.modules[family]]
+    
+    def display_families(self):
+        return [family for family in self.families
+                if family in ModuleData.REQUIRED_FAMILIES or self.modules[family]]
+    
+    @property
+    def cold_modules(self):
+        return self.modules['cold']
+    
+    @property
+    def warm_modules(self):
+        return self.modules['warm']
+    
+    @property
+    def cold_ports(self):
+        return self.ports['cold']
+    
+    @property
+    def warm_ports(self):
+        return self.ports['warm']
+    
+    @property
+    def cold_params(self):
+        return self.params['cold']
+    
+    @property
+    def warm_params(self):
+        return self.params['warm']
+    
     def clear(self):
-        self.cold_modules.clear()
-        self.warm_modules.clear()
-        self.cold_ports.clear()
-        self.warm_ports.clear()
+        for family in self.families:
+            self.modules[family].clear()
+            self.params[family].clear()
+            self.ports[family].clear()
         self.modified_data.clear()
+        self.pixel_edits.clear()
+        self.unsaved.clear()
         self.serial_number = None
         self.file_saved = None
         self.base_module_path = None
+        self.load_stats = LoadStats()
+        self.file_signatures.clear()
+        self.baseline_params.clear()
+        self.conflicts.clear()
+        self.connectivity = ConnectivityIndex()
+        for keys in self.pooled.values():
+            self.pool.release(keys)
+        self.pooled = {}
+    
+    @staticmethod
+    def _pixel_columns(module):
+        chip_type = ConfigLoader.get_chip_type(module['full_data'])
+        if chip_type is None:
+            return []
+        return module['full_data'][chip_type].get('PixelConfig', [])
+    
+    def share_pixel_arrays(self, module):
+        pooled = self.pooled.setdefault(module['file_path'], [])
+        for col in ModuleData._pixel_columns(module):
+            for key, values in col.items():
+                if isinstance(values, list):
+                    col[key] = self.pool.intern(values)
+                    pooled.append(col[key])
+    
+    def release_pixel_arrays(self, module):
+        self.pool.release(self.pooled.pop(module['file_path'], []))
+    
+    def storage_summary(self):
+        references = 0
+        unique = set()
+        for modules in self.modules.values():
+            for module in modules.values():
+                for col in ModuleData._pixel_columns(module):
+                    for values in col.values():
+                        if isinstance(values, (list, tuple)):
+                            references += 1
+                            unique.add(id(values))
+        return f"{len(unique)} unique pixel arrays for {references} references"
     
     def get_all_chip_ids(self):
-        return set(list(self.cold_modules.keys()) + list(self.warm_modules.keys()))
+        return set().union(*self.modules.values())
     
     def get_module_by_type(self, config_type):
-        return self.cold_modules if config_type == 'cold' else self.warm_modules
+        return self.modules[config_type]
     
     def get_ports_by_type(self, config_type):
-        return self.cold_ports if config_type == 'cold' else self.warm_ports
+        return self.ports[config_type]
+    
+    def build_connectivity(self):
+        self.connectivity = ConnectivityIndex.from_module(self)
+        return self.connectivity
+    
+    def get_params_by_type(self, config_type):
+        return self.params[config_type]
+    
+    def register_module(self, config_type, chipID):
+        module = self.get_module_by_type(config_type)[chipID]
+        self.share_pixel_arrays(module)
+        module['important_data'] = self.get_params_by_type(config_type).add_chip(
+            chipID, module['important_data']
+        )
+        return module
+    
+    def get_config_name(self, chipID):
+        for modules in self.modules.values():
+            if chipID in modules:
+                return modules[chipID].get('config_name', 'N/A')
+        return 'N/A'
+    
+    def record_modification(self, chipID, param, value, cfg_type, config_name):
+        key = f"{chipID}_{param}_{cfg_type}"
+        self.modified_data[key] = {
+            'chipID': chipID,
+            'param': param,
+            'value': value,
+            'type': cfg_type,
+            'config_name': config_name
+        }
+        self.conflicts.pop(key, None)
+        self.unsaved.add(key)
+        return key
+
+    def record_pixel_edit(self, chipID, cfg_type, config_name, operation):
+        key = f"{chipID}_PixelConfig_{cfg_type}"
+        edit = self.pixel_edits.setdefault(key, {
+            'chipID': chipID,
+            'type': cfg_type,
+            'config_name': config_name,
+            'operations': []
+        })
+        edit['operations'].append(operation)
+        self.conflicts.pop(key, None)
+        self.unsaved.add(key)
+        return key
+
+    @staticmethod
+    def describe_pixel_edit(edit):
+        return "; ".join(f"{op['op']} {'/'.join(op['fields'])} on {op['pixels']} pixels from {op['source']}"
+                         for op in edit['operations'])
+
+    def has_edits(self):
+        return bool(self.modified_data or self.pixel_edits)
+
+    def has_unsaved_changes(self):
+        return bool(self.unsaved)
+
+    def mark_saved(self):
+        self.unsaved.clear()
+        self.conflicts.clear()
+
+    def status_text(self, chipID, param):
+        status_text = ""
+        for cfg_type in self.families:
+            if f"{chipID}_{param}_{cfg_type}" in self.modified_data:
+                status_text += StyleConfig.family_icon(cfg_type)
+        if any(f"{chipID}_{param}_{cfg_type}" in self.conflicts for cfg_type in self.families):
+            status_text += "⚠️"
+        return status_text
 
 
 class ParameterValidator:
@@ -96,136 +369,2497 @@ class ParameterValidator:
     FLOAT_PARAMS = ["KSenseInA", "KSenseInD", "KSenseShuntA", "KSenseShuntD"]
     LIST_PARAMS = ["ADCcalPar"]
     
+    KINDS = {**dict.fromkeys(INTEGER_PARAMS, "integer"),
+             **dict.fromkeys(FLOAT_PARAMS, "float"),
+             **dict.fromkeys(LIST_PARAMS, "list")}
+    
     @staticmethod
     def get_type_hint(param):
-        return ParameterValidator.TYPE_HINTS.get(param, "string")
+        hint = ParameterValidator.TYPE_HINTS.get(param, "string")
+        limits = RegisterSchema.describe_entry(RegisterSchema.declared_entry(param))
+        return f"{hint}, {limits}" if limits else hint
+    
+    @staticmethod
+    def get_kind(param):
+        return ParameterValidator.KINDS.get(param, "string")
     
     @staticmethod
     def convert_value(param, val_str):
-        if param in ParameterValidator.INTEGER_PARAMS:
-            return int(val_str)
-        elif param in ParameterValidator.LIST_PARAMS:
-            return ast.literal_eval(val_str)
-        elif param in ParameterValidator.FLOAT_PARAMS:
-            return float(val_str)
-        return val_str
+        kind = ParameterValidator.get_kind(param)
+        if kind == "integer":
+            value = int(val_str)
+        elif kind == "list":
+            value = ast.literal_eval(val_str)
+        elif kind == "float":
+            value = float(val_str)
+        else:
+            return val_str
+        
+        reason = RegisterSchema.check_entry(RegisterSchema.declared_entry(param), value)
+        if reason:
+            raise ValueError(f"{param} {reason}")
+        return value
 
 
-class ConfigLoader:
+RegisterViolation = namedtuple('RegisterViolation', ['serial', 'cfg_type', 'chipID', 'param', 'value', 'reason'])
+
+
+class RegisterSchema:
+
+    DEFAULT_BITS = 16
     
-    IMPORTANT_PARAMS = [
-        "EnCoreCol0", "EnCoreCol1", "EnCoreCol2", "EnCoreCol3",
-        "SldoTrimA", "SldoTrimD", "ADCcalPar",
-        "KSenseInA", "KSenseInD", "KSenseShuntA", "KSenseShuntD"
-    ]
+    BIT_WIDTHS = {
+        "EnCoreCol0": 16, "EnCoreCol1": 16, "EnCoreCol2": 16, "EnCoreCol3": 6,
+        "SldoTrimA": 5, "SldoTrimD": 5,
+        "MonitorI": 6, "MonitorV": 6,
+        "DiffPreampL": 10, "DiffPreampR": 10, "DiffPreampM": 10,
+        "DiffPreampT": 10, "DiffPreampTL": 10, "DiffPreampTR": 10,
+        "DiffTh1L": 10, "DiffTh1R": 10, "DiffTh1M": 10, "DiffTh2": 10,
+        "DiffVff": 10, "DiffLcc": 10, "DiffComp": 10, "DiffPreComp": 10,
+        "InjVcalHigh": 12, "InjVcalMed": 12,
+        "ChipId": 4, "IrefTrim": 4
+    }
     
-    CHIP_TYPES = ["ITKPIXV2", "RD53B"]
+    VALUE_RANGES = {
+        "KSenseInA": (0.0, None), "KSenseInD": (0.0, None),
+        "KSenseShuntA": (0.0, None), "KSenseShuntD": (0.0, None),
+        "KShuntA": (0.0, None), "KShuntD": (0.0, None)
+    }
+    
+    LIST_LENGTHS = {"ADCcalPar": 3, "NtcCalPar": 3, "VcalPar": 2}
+    
+    VALUE_KINDS = [(bool, "bool"), (int, "float"), (float, "float"),
+                   (list, "list"), (tuple, "list"), (str, "string")]
+    
+    def __init__(self):
+        self.entries = {}
+        self.compiled = weakref.WeakSet()
 
     @staticmethod
-    def _extract_chip_info(chip_data):
-        for chip_type in ConfigLoader.CHIP_TYPES:
-            if chip_type in chip_data:
-                params = chip_data[chip_type].get("Parameter", {})
-                chipID = params.get("ChipId")
-                config_name = params.get("Name")
-                return chipID, config_name
-        return None, None
+    def _make_entry(param, kind, length=None):
+        bits = RegisterSchema.BIT_WIDTHS.get(param) if kind == "integer" else None
+        if bits:
+            lo, hi = 0, 2 ** bits - 1
+        else:
+            lo, hi = RegisterSchema.VALUE_RANGES.get(param, (None, None))
+        if kind == "list":
+            length = RegisterSchema.LIST_LENGTHS.get(param, length)
+        return (kind, bits, lo, hi, length)
+
     @staticmethod
-    def _create_module_entry(chip_data, chip_path, config_file, cfg_type, config_name):
-        imp_data = {}
+    def declared_entry(param):
+        if param in ParameterValidator.KINDS:
+            return RegisterSchema._make_entry(param, ParameterValidator.get_kind(param))
+        if param in RegisterSchema.BIT_WIDTHS:
+            return RegisterSchema._make_entry(param, "integer")
+        return None
+
+    def get_entry(self, param):
+        entry = self.entries.get(param)
+        if entry is None:
+            entry = RegisterSchema.declared_entry(param)
+            if entry is not None:
+                self.entries[param] = entry
+        return entry
+
+    def compile(self, chip_data):
+        chip_type = ConfigLoader.get_chip_type(chip_data)
+        if chip_type is None:
+            return
         
-        for chip_type in ConfigLoader.CHIP_TYPES:
-            if chip_type in chip_data:
-                gc = chip_data[chip_type].get("GlobalConfig", {})
-                pm = chip_data[chip_type].get("Parameter", {})
-                
-                for param in ConfigLoader.IMPORTANT_PARAMS:
-                    if param in gc:
-                        imp_data[param] = gc[param]
-                    elif param in pm:
-                        imp_data[param] = pm[param]
-                break
+        for param in chip_data[chip_type].get('GlobalConfig', {}):
+            if self.get_entry(param) is None:
+                self.entries[param] = ("integer", RegisterSchema.DEFAULT_BITS,
+                                       0, 2 ** RegisterSchema.DEFAULT_BITS - 1, None)
         
-        return {
-            'full_data': chip_data,
-            'important_data': imp_data,
-            'file_path': chip_path,
-            'config_name': config_name or os.path.basename(chip_path).replace(f'_L2_{cfg_type}.json', '')
-        }
+        for param, value in chip_data[chip_type].get('Parameter', {}).items():
+            if self.get_entry(param) is None:
+                kind = next((k for t, k in RegisterSchema.VALUE_KINDS if isinstance(value, t)), "string")
+                length = len(value) if kind == "list" else None
+                self.entries[param] = RegisterSchema._make_entry(param, kind, length)
+
+    def compile_module(self, module_data):
+        if module_data in self.compiled:
+            return
+        for cfg_type in module_data.families:
+            for module in module_data.get_module_by_type(cfg_type).values():
+                self.compile(module['full_data'])
+        self.compiled.add(module_data)
+
+    def describe(self, param):
+        return RegisterSchema.describe_entry(self.get_entry(param))
+
+    @staticmethod
+    def describe_entry(entry):
+        if entry is None:
+            return ""
+        kind, bits, lo, hi, length = entry
+        if bits:
+            return f"{bits}-bit, {lo}..{hi}"
+        if length:
+            return f"{length} values"
+        if lo is not None or hi is not None:
+            return f"range {'' if lo is None else lo}..{'' if hi is None else hi}"
+        return ""
+
+    def check(self, param, value):
+        return RegisterSchema.check_entry(self.get_entry(param), value)
+
+    @staticmethod
+    def check_entry(entry, value):
+        if entry is None:
+            return None
+        kind, bits, lo, hi, length = entry
+        
+        if kind == "integer" and type(value) is not int:
+            return "must be an integer"
+        if kind == "float" and type(value) not in (int, float):
+            return "must be a number"
+        if kind == "bool" and type(value) is not bool:
+            return "must be true or false"
+        if kind == "string" and not isinstance(value, str):
+            return "must be a string"
+        if kind == "list":
+            if not isinstance(value, (list, tuple)):
+                return "must be a list"
+            if length is not None and len(value) != length:
+                return f"must have {length} values"
+            return None
+        
+        if lo is not None and value < lo:
+            return f"exceeds {bits}-bit range {lo}..{hi}" if bits else f"is below minimum {lo}"
+        if hi is not None and value > hi:
+            return f"exceeds {bits}-bit range {lo}..{hi}" if bits else f"is above maximum {hi}"
+        return None
+
+    @staticmethod
+    def _failing_rows(entry, column):
+        kind, bits, lo, hi, length = entry
+        missing = ParameterStore.MISSING
+        lo = float('-inf') if lo is None else lo
+        hi = float('inf') if hi is None else hi
+        
+        if kind == "integer":
+            return [i for i, v in enumerate(column)
+                    if v is not missing and (type(v) is not int or not lo <= v <= hi)]
+        if kind == "float":
+            return [i for i, v in enumerate(column)
+                    if v is not missing and (type(v) not in (int, float) or not lo <= v <= hi)]
+        if kind == "list":
+            return [i for i, v in enumerate(column)
+                    if v is not missing and (not isinstance(v, (list, tuple))
+                                             or (length is not None and len(v) != length))]
+        expected = bool if kind == "bool" else str
+        return [i for i, v in enumerate(column) if v is not missing and not isinstance(v, expected)]
+
+    def _module_rows(self, module_data):
+        self.compile_module(module_data)
+        for cfg_type in module_data.families:
+            store = module_data.get_params_by_type(cfg_type)
+            for chipID, module in module_data.get_module_by_type(cfg_type).items():
+                chip_type = ConfigLoader.get_chip_type(module['full_data'])
+                if chip_type is None:
+                    continue
+                values = dict(module['full_data'][chip_type].get('GlobalConfig', {}))
+                values.update(module['full_data'][chip_type].get('Parameter', {}))
+                if chipID in store:
+                    values.update(store.row(chipID))
+                yield (module_data.serial_number, cfg_type, chipID), values
+
+    def validate_fleet(self, module_datas):
+        keys = []
+        rows = []
+        for module_data in module_datas:
+            for key, values in self._module_rows(module_data):
+                keys.append(key)
+                rows.append(values)
+        
+        violations = []
+        missing = ParameterStore.MISSING
+        for param in dict.fromkeys(param for values in rows for param in values):
+            entry = self.get_entry(param)
+            if entry is None:
+                continue
+            column = [values.get(param, missing) for values in rows]
+            for i in RegisterSchema._failing_rows(entry, column):
+                reason = RegisterSchema.check_entry(entry, column[i])
+                if reason:
+                    violations.append(RegisterViolation(*keys[i], param, column[i], reason))
+        return violations
+
+    def validate_module(self, module_data):
+        return self.validate_fleet([module_data])
+
+    @staticmethod
+    def format_report(violations, limit=20):
+        if not violations:
+            return ["✓ All registers within schema limits"]
+        
+        lines = [f"⚠️ {len(violations)} register violation(s):"]
+        for v in violations[:limit]:
+            lines.append(f"  • {v.serial} {v.cfg_type.upper()} ChipID {v.chipID}: "
+                         f"{v.param} = {v.value} {v.reason}")
+        if len(violations) > limit:
+            lines.append(f"  … and {len(violations) - limit} more")
+        return lines
+
+
+PortLink = namedtuple('PortLink', ['family', 'port', 'chipID', 'config_name', 'tx', 'rx', 'enable'])
+ConnectivityIssue = namedtuple('ConnectivityIssue', ['serial', 'kind', 'family', 'chipID', 'detail'])
+
+
+class ConnectivityIndex:
+
+    HEADER_CHARS = 65536
+    CHIP_ID_PATTERN = re.compile(r'"ChipId"\s*:\s*(-?\d+)')
+    NAME_PATTERN = re.compile(r'"Name"\s*:\s*"([^"]*)"')
+    PARALLEL_THRESHOLD = 64
+    
+    CHECK_LABELS = {
+        'duplicate_rx': "duplicate RX",
+        'enable_mismatch': "enable mismatch",
+        'missing_port': "missing from port"
+    }
+
+    def __init__(self, serial=None):
+        self.serial = serial
+        self.links = []
+        self.by_chip = {}
+        self.by_port = {}
+        self.by_channel = {}
+
+    def __len__(self):
+        return len(self.links)
+
+    def add(self, family, port, chip_info):
+        link = PortLink(family, port, chip_info['chipID'], chip_info.get('config_name'),
+                        chip_info.get('tx'), chip_info.get('rx'), chip_info.get('enable', 1))
+        self.links.append(link)
+        self.by_chip.setdefault(link.chipID, {}).setdefault(family, []).append(link)
+        self.by_port.setdefault((family, port), []).append(link)
+        self.by_channel.setdefault((family, link.tx, link.rx), []).append(link)
+        return link
+
+    @staticmethod
+    def from_ports(serial, ports):
+        index = ConnectivityIndex(serial)
+        for family, family_ports in ports.items():
+            for port_name, chips in family_ports.items():
+                for chip_info in chips:
+                    index.add(family, port_name, chip_info)
+        return index
+
+    @staticmethod
+    def from_module(module_data):
+        return ConnectivityIndex.from_ports(module_data.serial_number, module_data.ports)
+
+    def families(self):
+        return list(dict.fromkeys(family for family, _ in self.by_port))
+
+    def ports(self, family):
+        return [port for port_family, port in self.by_port if port_family == family]
+
+    def chip(self, chipID, family=None):
+        families = self.by_chip.get(chipID, {})
+        if family is None:
+            return [link for links in families.values() for link in links]
+        return families.get(family, [])
+
+    def port(self, family, port):
+        return self.by_port.get((family, port), [])
+
+    def channel(self, family, tx, rx):
+        return self.by_channel.get((family, tx, rx), [])
+
+    def is_enabled(self, chipID, family):
+        links = self.chip(chipID, family)
+        if not links:
+            return None
+        return all(link.enable for link in links)
+
+    @staticmethod
+    def _state_label(states):
+        if len(states) > 1:
+            return "mixed"
+        return "enabled" if True in states else "disabled"
+
+    def check(self):
+        issues = []
+        
+        for (family, tx, rx), links in self.by_channel.items():
+            chips = sorted({link.chipID for link in links})
+            if rx is not None and len(chips) > 1:
+                issues.append(ConnectivityIssue(self.serial, 'duplicate_rx', family, ", ".join(chips),
+                                                f"TX {tx} RX {rx} is assigned to {len(chips)} chips"))
+        
+        for chipID, families in self.by_chip.items():
+            states = {family: {bool(link.enable) for link in links} for family, links in families.items()}
+            if len(set().union(*states.values())) > 1:
+                detail = ", ".join(f"{family.upper()} {ConnectivityIndex._state_label(family_states)}"
+                                   for family, family_states in states.items())
+                issues.append(ConnectivityIssue(self.serial, 'enable_mismatch', None, chipID, detail))
+        
+        for (family, port), links in self.by_port.items():
+            listed = {link.chipID for link in links}
+            for chipID in sorted(set(self.by_chip) - listed):
+                issues.append(ConnectivityIssue(self.serial, 'missing_port', family, chipID, f"not listed in {port}"))
+        
+        return issues
+
+    @staticmethod
+    def chip_identity(chip_path):
+        with ConfigIO.open_text(chip_path) as f:
+            head = f.read(ConnectivityIndex.HEADER_CHARS)
+        chip_id = ConnectivityIndex.CHIP_ID_PATTERN.search(head)
+        name = ConnectivityIndex.NAME_PATTERN.search(head)
+        if chip_id is not None and name is not None:
+            return chip_id.group(1), name.group(1)
+        
+        chipID, config_name = ConfigLoader._extract_chip_info(
+            ConfigLoader._decode_chip_payload(ConfigLoader._read_chip_payload(chip_path))
+        )
+        return (str(chipID) if chipID is not None else None), config_name
+
+    @staticmethod
+    def scan_module(base_path, families=None):
+        index = ConnectivityIndex(os.path.basename(os.path.normpath(base_path)))
+        present = [family for family in families or ModuleData.FAMILIES
+                   if os.path.isdir(os.path.join(base_path, f"L2_{family}"))]
+        port_files = ConfigLoader.classify_port_files(base_path, present)
+        identities = {}
+        
+        for family in present:
+            for port_file in port_files[family]:
+                try:
+                    port_name, chips = ConfigLoader._load_port_file(base_path, port_file)
+                except Exception as e:
+                    print(f"Error loading {port_file}: {str(e)}")
+                    continue
+                
+                for chip, chip_path in chips:
+                    if chip_path not in identities:
+                        try:
+                            identities[chip_path] = ConnectivityIndex.chip_identity(chip_path)
+                        except Exception as e:
+                            print(f"Error loading {chip_path}: {str(e)}")
+                            identities[chip_path] = (None, None)
+                    chipID, config_name = identities[chip_path]
+                    if chipID is not None:
+                        index.add(family, port_name, ConfigLoader._port_entry(chip, chipID, config_name))
+        return index
+
+    @staticmethod
+    def _is_module(path):
+        return os.path.isdir(path) and any(os.path.isdir(os.path.join(path, f"L2_{family}"))
+                                           for family in ModuleData.FAMILIES)
+
+    @staticmethod
+    def find_modules(paths):
+        modules = []
+        for path in paths:
+            if ConnectivityIndex._is_module(path):
+                modules.append(path)
+            elif os.path.isdir(path):
+                modules += [os.path.join(path, name) for name in sorted(os.listdir(path))
+                            if not name.endswith("_modified") and ConnectivityIndex._is_module(os.path.join(path, name))]
+        return modules
+
+    @staticmethod
+    def check_module(base_path):
+        index = ConnectivityIndex.scan_module(base_path)
+        return index.serial, len(index), index.check()
+
+    @staticmethod
+    def check_fleet(paths, workers=None):
+        modules = ConnectivityIndex.find_modules(paths)
+        if len(modules) < ConnectivityIndex.PARALLEL_THRESHOLD or workers == 1:
+            return [ConnectivityIndex.check_module(path) for path in modules]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(ConnectivityIndex.check_module, modules, chunksize=4))
+
+    @staticmethod
+    def format_report(issues, limit=20):
+        if not issues:
+            return ["✓ Port connectivity is consistent"]
+        
+        lines = [f"⚠️ {len(issues)} connectivity issue(s):"]
+        for issue in issues[:limit]:
+            family = f" {issue.family.upper()}" if issue.family else ""
+            lines.append(f"  • {issue.serial}{family} ChipID {issue.chipID}: "
+                         f"{ConnectivityIndex.CHECK_LABELS[issue.kind]} ({issue.detail})")
+        if len(issues) > limit:
+            lines.append(f"  … and {len(issues) - limit} more")
+        return lines
+
+    @staticmethod
+    def format_fleet_report(results, limit=20):
+        lines = []
+        for serial, links, issues in results:
+            status = "✅" if not issues else "❌"
+            lines.append(f"{status} {serial}: {links} port links, {len(issues)} issue(s)")
+            if issues:
+                lines.extend(ConnectivityIndex.format_report(issues, limit)[1:])
+        
+        total = sum(len(issues) for _, _, issues in results)
+        lines.append(f"\n{len(results)} module(s) checked, {total} issue(s) in "
+                     f"{sum(1 for _, _, issues in results if issues)} module(s)")
+        return lines
+
+
+class ConfigIO:
+
+    COMPRESSED_SUFFIXES = ['.gz', '.zst']
+
+    @staticmethod
+    def strip_suffix(path):
+        for suffix in ConfigIO.COMPRESSED_SUFFIXES:
+            if path.endswith(suffix):
+                return path[:-len(suffix)]
+        return path
+
+    @staticmethod
+    def is_json_name(name):
+        return ConfigIO.strip_suffix(name).endswith('.json')
+
+    @staticmethod
+    def resolve(path):
+        for candidate in [path] + [path + suffix for suffix in ConfigIO.COMPRESSED_SUFFIXES]:
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def with_compression(path, compression=None):
+        path = ConfigIO.strip_suffix(path)
+        return f"{path}.{compression}" if compression else path
+
+    @staticmethod
+    def remove_variants(path):
+        base = ConfigIO.strip_suffix(path)
+        for candidate in [base] + [base + suffix for suffix in ConfigIO.COMPRESSED_SUFFIXES]:
+            if candidate != path and os.path.exists(candidate):
+                os.remove(candidate)
+
+    @staticmethod
+    def read_bytes(path):
+        if path.endswith('.gz'):
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise ValueError(f"Cannot open {path}: the zstandard package is not installed")
+            with zstandard.open(path, 'rb') as f:
+                return f.read()
+        with open(path, 'rb') as f:
+            return f.read()
+
+    @staticmethod
+    def open_text(path, mode='r'):
+        if path.endswith('.gz'):
+            return gzip.open(path, mode + 't', encoding='utf-8')
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise ValueError(f"Cannot open {path}: the zstandard package is not installed")
+            return zstandard.open(path, mode + 't', encoding='utf-8')
+        return open(path, mode)
+
+
+class JsonChunkWriter:
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, f):
+        self.f = f
+        self.pieces = []
+        self.size = 0
+        self.flushed = False
+
+    def append(self, piece):
+        self.pieces.append(piece)
+        self.size += len(piece)
+        if self.size >= JsonChunkWriter.CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.pieces:
+            self.f.write("".join(self.pieces))
+            self.flushed = True
+        self.pieces = []
+        self.size = 0
+
+
+class JsonCodec:
+
+    INDENT = "    "
+    STYLES = ['indent', 'inline']
+    BACKENDS = ['orjson', 'ujson', 'stdlib']
+    _encode_string = json.encoder.encode_basestring_ascii
+    _float_repr = float.__repr__
+
+    @staticmethod
+    def available_backends():
+        modules = {'orjson': orjson, 'ujson': ujson, 'stdlib': json}
+        return [name for name in JsonCodec.BACKENDS if modules[name] is not None]
+
+    @staticmethod
+    def _parser(name):
+        if name == 'orjson':
+            return orjson.loads
+        if name == 'ujson':
+            return ujson.loads
+        return json.loads
+
+    @staticmethod
+    def use(name=None):
+        available = JsonCodec.available_backends()
+        if name is None:
+            name = os.environ.get("ATLAS_JSON_BACKEND") or available[0]
+            if name not in available:
+                print(f"Ignoring ATLAS_JSON_BACKEND={name}: not available "
+                      f"(installed: {', '.join(available)}), using {available[0]}")
+                name = available[0]
+        elif name not in available:
+            raise ValueError(f"JSON backend {name} is not available (installed: {', '.join(available)})")
+        JsonCodec.backend = name
+        JsonCodec._loads = staticmethod(JsonCodec._parser(name))
+        return name
+
+    @staticmethod
+    def loads(data):
+        try:
+            return JsonCodec._loads(data)
+        except (ValueError, OverflowError):
+            if JsonCodec.backend == 'stdlib':
+                raise
+            return json.loads(data)
+
+    @staticmethod
+    def load(f):
+        return JsonCodec.loads(f.read())
+
+    @staticmethod
+    def _scalar(value):
+        if isinstance(value, str):
+            return JsonCodec._encode_string(value)
+        if value is None:
+            return 'null'
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            if value != value:
+                return 'NaN'
+            if value in (math.inf, -math.inf):
+                return 'Infinity' if value > 0 else '-Infinity'
+            return JsonCodec._float_repr(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    @staticmethod
+    def _encode(value, indent, pieces, memo):
+        if isinstance(value, dict):
+            if not value:
+                pieces.append("{}")
+                return
+            inner = indent + JsonCodec.INDENT
+            separator = "{\n" + inner
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError("Non-string keys are left to the stdlib encoder")
+                pieces.append(separator + JsonCodec._encode_string(key) + ": ")
+                JsonCodec._encode(item, inner, pieces, memo)
+                separator = ",\n" + inner
+            pieces.append("\n" + indent + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                pieces.append("[]")
+                return
+            inner = indent + JsonCodec.INDENT
+            if set(map(type, value)) == {int}:
+                key = (indent, tuple(value))
+                text = memo.get(key)
+                if text is None:
+                    text = "[\n" + inner + (",\n" + inner).join(map(int.__repr__, value)) + "\n" + indent + "]"
+                    memo[key] = text
+                pieces.append(text)
+                return
+            separator = "[\n" + inner
+            for item in value:
+                pieces.append(separator)
+                JsonCodec._encode(item, inner, pieces, memo)
+                separator = ",\n" + inner
+            pieces.append("\n" + indent + "]")
+        else:
+            pieces.append(JsonCodec._scalar(value))
+
+    @staticmethod
+    def _encode_inline(value, indent, pieces):
+        if isinstance(value, dict):
+            if not value:
+                pieces.append("{}")
+                return
+            inner = indent + JsonCodec.INDENT
+            separator = "{\n" + inner
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError("Non-string keys cannot be written inline")
+                pieces.append(separator + JsonCodec._encode_string(key) + ": ")
+                JsonCodec._encode_inline(item, inner, pieces)
+                separator = ",\n" + inner
+            pieces.append("\n" + indent + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                pieces.append("[]")
+                return
+            inner = indent + JsonCodec.INDENT
+            separator = "["
+            for item in value:
+                pieces.append(separator)
+                JsonCodec._encode_inline(item, inner, pieces)
+                separator = ", "
+            pieces.append("]")
+        else:
+            pieces.append(JsonCodec._scalar(value))
+
+    @staticmethod
+    def dumps(data, style='indent'):
+        pieces = []
+        if style == 'inline':
+            JsonCodec._encode_inline(data, "", pieces)
+            return "".join(pieces)
+        try:
+            JsonCodec._encode(data, "", pieces, {})
+        except TypeError:
+            return json.dumps(data, indent=4)
+        return "".join(pieces)
+
+    @staticmethod
+    def dump(data, f, style='indent'):
+        writer = JsonChunkWriter(f)
+        try:
+            if style == 'inline':
+                JsonCodec._encode_inline(data, "", writer)
+            else:
+                JsonCodec._encode(data, "", writer, {})
+        except TypeError:
+            if writer.flushed or style == 'inline':
+                raise
+            json.dump(data, f, indent=4)
+            return
+        writer.flush()
+
+    @staticmethod
+    def benchmark(paths, repeat=3):
+        results = {}
+        for path in paths:
+            raw = ConfigIO.read_bytes(path)
+            reference = json.loads(raw)
+            expected = json.dumps(reference, indent=4)
+            
+            for name in JsonCodec.available_backends():
+                parser = JsonCodec._parser(name)
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    parsed = parser(raw)
+                elapsed = (time.perf_counter() - start) / repeat
+                same = json.dumps(parsed) == json.dumps(reference)
+                total = results.setdefault(f"load:{name}", [0.0, True])
+                total[0] += elapsed
+                total[1] = total[1] and same
+            
+            for name, writer in [('stdlib', lambda d: json.dumps(d, indent=4)), ('fast', JsonCodec.dumps)]:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    text = writer(reference)
+                elapsed = (time.perf_counter() - start) / repeat
+                total = results.setdefault(f"dump:{name}", [0.0, True])
+                total[0] += elapsed
+                total[1] = total[1] and text == expected
+        return results
+
+
+JsonCodec.use()
+
+
+class BinaryConfig:
+
+    EXTENSION = ".cfgbin"
+    MAGIC = b"ATLASCFG"
+    VERSION = 1
+    ARRAY_KEY = "\0array"
+    MIN_ARRAY_LENGTH = 16
+    ALIGNMENT = 8
+    TYPECODES = [('b', -2**7, 2**7 - 1), ('h', -2**15, 2**15 - 1),
+                 ('i', -2**31, 2**31 - 1), ('q', -2**63, 2**63 - 1)]
+
+    @staticmethod
+    def sidecar_path(json_path):
+        json_path = ConfigIO.strip_suffix(json_path)
+        base = json_path[:-len('.json')] if json_path.endswith('.json') else json_path
+        return base + BinaryConfig.EXTENSION
+
+    @staticmethod
+    def _source_stamp(source_path):
+        st = os.stat(source_path)
+        return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+    @staticmethod
+    def _typecode(values):
+        if len(values) < BinaryConfig.MIN_ARRAY_LENGTH:
+            return None
+        if all(type(v) is float for v in values):
+            return 'd'
+        if not all(type(v) is int for v in values):
+            return None
+        lo, hi = min(values), max(values)
+        for code, tmin, tmax in BinaryConfig.TYPECODES:
+            if tmin <= lo and hi <= tmax:
+                return code
+        return None
+
+    @staticmethod
+    def _pack(node, arrays, seen):
+        if isinstance(node, dict):
+            if any(key.startswith("\0") for key in node):
+                raise ValueError("Document contains reserved keys")
+            return {key: BinaryConfig._pack(value, arrays, seen) for key, value in node.items()}
+        if isinstance(node, (list, tuple)):
+            if id(node) in seen:
+                arrays.append(seen[id(node)])
+                return {BinaryConfig.ARRAY_KEY: len(arrays) - 1}
+            code = BinaryConfig._typecode(node)
+            if code is not None:
+                seen[id(node)] = len(arrays)
+                arrays.append(array(code, node))
+                return {BinaryConfig.ARRAY_KEY: len(arrays) - 1}
+            return [BinaryConfig._pack(value, arrays, seen) for value in node]
+        return node
+
+    @staticmethod
+    def _unpack(node, arrays):
+        if isinstance(node, dict):
+            if len(node) == 1 and BinaryConfig.ARRAY_KEY in node:
+                return arrays[node[BinaryConfig.ARRAY_KEY]]
+            return {key: BinaryConfig._unpack(value, arrays) for key, value in node.items()}
+        if isinstance(node, list):
+            return [BinaryConfig._unpack(value, arrays) for value in node]
+        return node
+
+    @staticmethod
+    def text_format(buffer, data):
+        for style in JsonCodec.STYLES:
+            try:
+                text = JsonCodec.dumps(data, style).encode('utf-8')
+            except TypeError:
+                continue
+            if buffer == text or buffer == text + b"\n":
+                return {'style': style, 'newline': buffer != text, 'sha1': hashlib.sha1(buffer).hexdigest()}
+        return None
+
+    @staticmethod
+    def write(path, data, source_path=None, text_format=None):
+        arrays = []
+        document = BinaryConfig._pack(data, arrays, {})
+        
+        blocks = {}
+        layout = []
+        for arr in arrays:
+            if isinstance(arr, int):
+                layout.append(list(layout[arr]))
+                continue
+            block = blocks.setdefault(arr.typecode, array(arr.typecode))
+            layout.append([arr.typecode, len(block), len(arr)])
+            block.extend(arr)
+        
+        block_layout = []
+        offset = 0
+        for code, block in blocks.items():
+            block_layout.append([code, offset, len(block)])
+            offset += block.itemsize * len(block)
+            offset += -offset % BinaryConfig.ALIGNMENT
+        
+        header = json.dumps({
+            'version': BinaryConfig.VERSION,
+            'byteorder': sys.byteorder,
+            'source': BinaryConfig._source_stamp(source_path) if source_path else None,
+            'format': text_format,
+            'blocks': block_layout,
+            'arrays': layout,
+            'document': document
+        }, separators=(',', ':')).encode('utf-8')
+        
+        prefix = len(BinaryConfig.MAGIC) + 4 + len(header)
+        header += b" " * (-prefix % BinaryConfig.ALIGNMENT)
+        
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(BinaryConfig.MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            for block in blocks.values():
+                block.tofile(f)
+                f.write(b"\0" * (-(block.itemsize * len(block)) % BinaryConfig.ALIGNMENT))
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def _read_header(view):
+        magic_len = len(BinaryConfig.MAGIC)
+        if bytes(view[:magic_len]) != BinaryConfig.MAGIC:
+            raise ValueError("Not a binary configuration file")
+        (header_len,) = struct.unpack('<I', view[magic_len:magic_len + 4])
+        start = magic_len + 4
+        header = json.loads(bytes(view[start:start + header_len]))
+        if header.get('version') != BinaryConfig.VERSION:
+            raise ValueError(f"Unsupported binary configuration version: {header.get('version')}")
+        return header, start + header_len
+
+    @staticmethod
+    def decode(buffer, source_path=None):
+        with memoryview(buffer) as view:
+            header, base = BinaryConfig._read_header(view)
+            
+            if source_path is not None and header.get('source') != BinaryConfig._source_stamp(source_path):
+                return None
+            
+            swap = header.get('byteorder') != sys.byteorder
+            blocks = {}
+            for code, offset, count in header['blocks']:
+                start = base + offset
+                with view[start:start + array(code).itemsize * count] as chunk:
+                    if swap:
+                        block = array(code, chunk.tobytes())
+                        block.byteswap()
+                        blocks[code] = block.tolist()
+                    else:
+                        with chunk.cast(code) as values:
+                            blocks[code] = values.tolist()
+        
+        arrays = [blocks[code][start:start + count] for code, start, count in header['arrays']]
+        return BinaryConfig._unpack(header['document'], arrays)
+
+    @staticmethod
+    def load(path, source_path=None):
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return BinaryConfig.decode(mm, source_path)
+
+    @staticmethod
+    def read_header(path):
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return BinaryConfig._read_header(view)[0]
+
+    @staticmethod
+    def read_if_fresh(json_path):
+        bin_path = BinaryConfig.sidecar_path(json_path)
+        if not os.path.exists(bin_path):
+            return None
+        try:
+            with open(bin_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with memoryview(mm) as view:
+                header, _ = BinaryConfig._read_header(view)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring binary configuration {bin_path}: {str(e)}")
+            return None
+        if header.get('source') != BinaryConfig._source_stamp(json_path):
+            mm.close()
+            return None
+        return mm
+
+    @staticmethod
+    def load_if_fresh(json_path):
+        bin_path = BinaryConfig.sidecar_path(json_path)
+        if not os.path.exists(bin_path):
+            return None
+        try:
+            return BinaryConfig.load(bin_path, source_path=json_path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring binary configuration {bin_path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def convert_json(json_path):
+        buffer = ConfigIO.read_bytes(json_path)
+        data = JsonCodec.loads(buffer)
+        text_format = BinaryConfig.text_format(buffer, data)
+        
+        bin_path = BinaryConfig.write(BinaryConfig.sidecar_path(json_path), data,
+                                      source_path=json_path, text_format=text_format)
+        
+        if json.dumps(BinaryConfig.load(bin_path)) != json.dumps(data):
+            os.remove(bin_path)
+            raise ValueError(f"Binary round-trip mismatch for {json_path}")
+        if text_format is None:
+            print(f"Note: {json_path} uses a layout that cannot be reproduced, {bin_path} cannot be exported back to JSON")
+        return bin_path
+
+    @staticmethod
+    def export_json(bin_path, json_path):
+        text_format = BinaryConfig.read_header(bin_path).get('format')
+        if text_format is None:
+            raise ValueError(f"{bin_path} does not record a reproducible JSON layout")
+        
+        text = JsonCodec.dumps(BinaryConfig.load(bin_path), text_format['style'])
+        encoded = (text + ("\n" if text_format['newline'] else "")).encode('utf-8')
+        if text_format['sha1'] is not None and hashlib.sha1(encoded).hexdigest() != text_format['sha1']:
+            raise ValueError(f"Export of {bin_path} would not be byte-identical to its source JSON")
+        
+        tmp_path = json_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(encoded)
+        os.replace(tmp_path, json_path)
+        return json_path
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+class LoadStats:
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.io_time = 0.0
+        self.io_wait = 0.0
+        self.parse_time = 0.0
+        self.wall_time = 0.0
+
+    def summary(self):
+        return (f"{self.files} files, {self.bytes / 1e6:.1f} MB in {self.wall_time * 1000:.0f} ms "
+                f"(I/O {self.io_time * 1000:.0f} ms, I/O wait {self.io_wait * 1000:.0f} ms, "
+                f"parse {self.parse_time * 1000:.0f} ms)")
+
+
+class PrefetchReader:
+
+    def __init__(self, depth=8):
+        self.depth = max(1, depth)
+        self.executor = ThreadPoolExecutor(max_workers=self.depth)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _timed_read(read_func, path):
+        start = time.perf_counter()
+        try:
+            return read_func(path), None, time.perf_counter() - start
+        except Exception as e:
+            return None, e, time.perf_counter() - start
+
+    def iter_read(self, paths, read_func, stats):
+        paths = iter(paths)
+        pending = deque()
+        
+        def submit_next():
+            path = next(paths, None)
+            if path is not None:
+                pending.append((path, self.executor.submit(PrefetchReader._timed_read, read_func, path)))
+        
+        for _ in range(self.depth):
+            submit_next()
+        
+        while pending:
+            path, future = pending.popleft()
+            start = time.perf_counter()
+            payload, error, io_time = future.result()
+            stats.io_wait += time.perf_counter() - start
+            stats.io_time += io_time
+            submit_next()
+            yield path, payload, error
+
+
+class ParameterRow(MutableMapping):
+
+    def __init__(self, store, chipID):
+        self.store = store
+        self.chipID = chipID
+
+    def __getitem__(self, param):
+        value = self.store.get(self.chipID, param)
+        if value is ParameterStore.MISSING:
+            raise KeyError(param)
+        return value
+
+    def __setitem__(self, param, value):
+        self.store.set(self.chipID, param, value)
+
+    def __delitem__(self, param):
+        if param not in self:
+            raise KeyError(param)
+        self.store.set(self.chipID, param, ParameterStore.MISSING)
+
+    def __contains__(self, param):
+        return self.store.get(self.chipID, param) is not ParameterStore.MISSING
+
+    def __iter__(self):
+        return iter(self.store.chip_params(self.chipID))
+
+    def __len__(self):
+        return len(self.store.chip_params(self.chipID))
+
+
+class ParameterStore:
+
+    MISSING = object()
+    _epochs = itertools.count()
+
+    def __init__(self, params=None):
+        self._reset(params)
+
+    def _reset(self, params=None):
+        self.epoch = next(ParameterStore._epochs)
+        self.params = list(params if params is not None else ConfigLoader.IMPORTANT_PARAMS)
+        self.param_index = {param: i for i, param in enumerate(self.params)}
+        self.chip_ids = []
+        self.chip_index = {}
+        self.columns = [[] for _ in self.params]
+        self.row_revisions = []
+        self.revision = 0
+
+    def __len__(self):
+        return len(self.chip_ids)
+
+    def __contains__(self, chipID):
+        return chipID in self.chip_index
+
+    def _add_param(self, param):
+        self.param_index[param] = len(self.params)
+        self.params.append(param)
+        self.columns.append([ParameterStore.MISSING] * len(self.chip_ids))
+        return self.param_index[param]
+
+    def add_chip(self, chipID, values=None):
+        if chipID not in self.chip_index:
+            self.chip_index[chipID] = len(self.chip_ids)
+            self.chip_ids.append(chipID)
+            self.row_revisions.append(0)
+            for column in self.columns:
+                column.append(ParameterStore.MISSING)
+        for param, value in (values or {}).items():
+            self.set(chipID, param, value)
+        return ParameterRow(self, chipID)
+
+    def get(self, chipID, param, default=MISSING):
+        row = self.chip_index.get(chipID)
+        col = self.param_index.get(param)
+        if row is None or col is None:
+            return default
+        value = self.columns[col][row]
+        return default if value is ParameterStore.MISSING else value
+
+    def set(self, chipID, param, value):
+        col = self.param_index.get(param)
+        if col is None:
+            col = self._add_param(param)
+        row = self.chip_index[chipID]
+        self.columns[col][row] = value
+        self.row_revisions[row] += 1
+        self.revision += 1
+
+    def row(self, chipID):
+        return ParameterRow(self, chipID) if chipID in self.chip_index else None
+
+    def column(self, param):
+        col = self.param_index.get(param)
+        if col is None:
+            return [ParameterStore.MISSING] * len(self.chip_ids)
+        return self.columns[col]
+
+    def chip_params(self, chipID):
+        row = self.chip_index.get(chipID)
+        if row is None:
+            return []
+        return [param for param, column in zip(self.params, self.columns)
+                if column[row] is not ParameterStore.MISSING]
+
+    def row_revision(self, chipID):
+        row = self.chip_index.get(chipID)
+        return -1 if row is None else self.row_revisions[row]
+
+    def aligned_column(self, param, chip_ids):
+        column = self.column(param)
+        index = self.chip_index
+        return [column[index[chipID]] if chipID in index else ParameterStore.MISSING
+                for chipID in chip_ids]
+
+    def compare(self, other, param):
+        ours = self.column(param)
+        theirs = other.aligned_column(param, self.chip_ids)
+        return [chipID for chipID, a, b in zip(self.chip_ids, ours, theirs)
+                if a is not ParameterStore.MISSING and b is not ParameterStore.MISSING and a != b]
+
+    def snapshot(self):
+        copy = ParameterStore(self.params)
+        copy.chip_ids = list(self.chip_ids)
+        copy.chip_index = dict(self.chip_index)
+        copy.columns = [list(column) for column in self.columns]
+        copy.row_revisions = list(self.row_revisions)
+        copy.revision = self.revision
+        return copy
+
+    def clear(self):
+        self._reset()
+
+
+class ConfigLoader:
+    
+    IMPORTANT_PARAMS = [
+        "EnCoreCol0", "EnCoreCol1", "EnCoreCol2", "EnCoreCol3",
+        "SldoTrimA", "SldoTrimD", "ADCcalPar",
+        "KSenseInA", "KSenseInD", "KSenseShuntA", "KSenseShuntD"
+    ]
+    
+    CHIP_TYPES = ["ITKPIXV2", "RD53B"]
+    
+    PREFETCH_DEPTH = 8
+    
+    PORT_FILE_PATTERN = re.compile(r'^(?P<module>.+)_L2_(?P<family>[^_]+)_YarrPort(?P<port>\d+)\.json(?:\.gz|\.zst)?$')
+    CHIP_FILE_PATTERN = re.compile(r'^(?P<chip>.+)_L2_(?P<family>[^_]+)\.json(?:\.gz|\.zst)?$')
+
+    @staticmethod
+    def classify_port_files(base_path, families):
+        lookup = {family.lower(): family for family in families}
+        classified = {family: [] for family in families}
+        
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                match = ConfigLoader.PORT_FILE_PATTERN.match(entry.name)
+                if match is None or not entry.is_file():
+                    continue
+                family = lookup.get(match.group('family').lower())
+                if family is not None:
+                    classified[family].append((int(match.group('port')), entry.name))
+        
+        return {family: [name for _, name in sorted(files)] for family, files in classified.items()}
+
+    @staticmethod
+    def get_chip_type(chip_data):
+        for chip_type in ConfigLoader.CHIP_TYPES:
+            if chip_type in chip_data:
+                return chip_type
+        return None
+
+    @staticmethod
+    def _extract_chip_info(chip_data):
+        for chip_type in ConfigLoader.CHIP_TYPES:
+            if chip_type in chip_data:
+                params = chip_data[chip_type].get("Parameter", {})
+                chipID = params.get("ChipId")
+                config_name = params.get("Name")
+                return chipID, config_name
+        return None, None
+    @staticmethod
+    def extract_important(chip_data):
+        imp_data = {}
+        
+        for chip_type in ConfigLoader.CHIP_TYPES:
+            if chip_type in chip_data:
+                gc = chip_data[chip_type].get("GlobalConfig", {})
+                pm = chip_data[chip_type].get("Parameter", {})
+                
+                for param in ConfigLoader.IMPORTANT_PARAMS:
+                    if param in gc:
+                        imp_data[param] = gc[param]
+                    elif param in pm:
+                        imp_data[param] = pm[param]
+                break
+        
+        return imp_data
+
+    @staticmethod
+    def _create_module_entry(chip_data, chip_path, config_file, cfg_type, config_name):
+        return {
+            'full_data': chip_data,
+            'important_data': ConfigLoader.extract_important(chip_data),
+            'file_path': chip_path,
+            'config_name': config_name or os.path.basename(ConfigIO.strip_suffix(chip_path)).replace(f'_L2_{cfg_type}.json', '')
+        }
+
+    @staticmethod
+    def _read_chip_payload(chip_path):
+        st = os.stat(chip_path)
+        buffer = BinaryConfig.read_if_fresh(chip_path)
+        if buffer is not None:
+            return 'binary', buffer, (st.st_mtime_ns, st.st_size, None)
+        buffer = ConfigIO.read_bytes(chip_path)
+        return 'json', buffer, (st.st_mtime_ns, st.st_size, hashlib.sha1(buffer).hexdigest())
+
+    @staticmethod
+    def _decode_chip_payload(payload):
+        kind, buffer, _ = payload
+        if kind == 'binary':
+            with buffer:
+                return BinaryConfig.decode(buffer)
+        return JsonCodec.loads(buffer)
+
+    @staticmethod
+    def _port_entry(chip, chipID, config_name):
+        return {
+            'chipID': chipID,
+            'config_name': config_name,
+            'rx': chip.get('rx'),
+            'tx': chip.get('tx'),
+            'enable': chip.get('enable', 1)
+        }
+
+    @staticmethod
+    def _process_chip(chip, cfg_type, chip_path, chip_data, port_list, modules_dict):
+        chipID, config_name = ConfigLoader._extract_chip_info(chip_data)
+        if chipID is None:
+            return
+        
+        chipID = str(chipID)
+        
+        port_list.append(ConfigLoader._port_entry(chip, chipID, config_name))
+        
+        if chipID not in modules_dict:
+            modules_dict[chipID] = ConfigLoader._create_module_entry(
+                chip_data, chip_path, chip.get('config', ''), cfg_type, config_name
+            )
+            return chipID
+        return None
+
+    @staticmethod
+    def _load_port_file(base_path, port_file):
+        with ConfigIO.open_text(os.path.join(base_path, port_file)) as f:
+            port_data = JsonCodec.load(f)
+        
+        port_name = ConfigIO.strip_suffix(port_file).replace('.json', '')
+        chips = []
+        
+        for chip in port_data.get('chips', []):
+            config_file = chip.get('config', '')
+            if not config_file:
+                continue
+            chip_path = ConfigIO.resolve(os.path.join(base_path, config_file))
+            if chip_path is not None:
+                chips.append((chip, chip_path))
+        
+        return port_name, chips
+    
+    @staticmethod
+    def _read_chips(chip_paths, stats, prefetch_depth, cancel_event=None, signatures=None):
+        chip_data = {}
+        signatures = {} if signatures is None else signatures
+        
+        with PrefetchReader(prefetch_depth) as reader:
+            for chip_path, payload, error in reader.iter_read(chip_paths, ConfigLoader._read_chip_payload, stats):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled()
+                if error is not None:
+                    print(f"Error loading {chip_path}: {str(error)}")
+                    continue
+                
+                start = time.perf_counter()
+                size = len(payload[1])
+                try:
+                    chip_data[chip_path] = ConfigLoader._decode_chip_payload(payload)
+                except Exception as e:
+                    print(f"Error loading {chip_path}: {str(e)}")
+                    continue
+                finally:
+                    stats.parse_time += time.perf_counter() - start
+                
+                signatures[chip_path] = payload[2]
+                stats.files += 1
+                stats.bytes += size
+        
+        return chip_data
+    
+    @staticmethod
+    def load_families(base_path, module_data, families=None, prefetch_depth=None, cancel_event=None):
+        families = list(families or module_data.families)
+        for family in families:
+            module_data.add_family(family)
+        
+        start = time.perf_counter()
+        stats = module_data.load_stats
+        
+        present = [family for family in families if os.path.exists(os.path.join(base_path, f"L2_{family}"))]
+        port_files = ConfigLoader.classify_port_files(base_path, present)
+        
+        ports = []
+        for family in present:
+            for port_file in port_files[family]:
+                try:
+                    ports.append((family,) + ConfigLoader._load_port_file(base_path, port_file))
+                except Exception as e:
+                    print(f"Error loading {port_file}: {str(e)}")
+                    continue
+        
+        chip_paths = list(dict.fromkeys(chip_path for _, _, chips in ports for _, chip_path in chips))
+        chip_data = ConfigLoader._read_chips(chip_paths, stats, prefetch_depth or ConfigLoader.PREFETCH_DEPTH,
+                                             cancel_event, module_data.file_signatures)
+        
+        for family, port_name, chips in ports:
+            port_dict = module_data.get_ports_by_type(family)
+            modules_dict = module_data.get_module_by_type(family)
+            port_dict[port_name] = []
+            for chip, chip_path in chips:
+                if chip_path in chip_data:
+                    chipID = ConfigLoader._process_chip(chip, family, chip_path, chip_data[chip_path],
+                                                        port_dict[port_name], modules_dict)
+                    if chipID is not None:
+                        module_data.register_module(family, chipID)
+        
+        for family in present:
+            module_data.baseline_params[family] = module_data.get_params_by_type(family).snapshot()
+        module_data.build_connectivity()
+        stats.wall_time += time.perf_counter() - start
+        return {family: len(module_data.get_module_by_type(family)) > 0 for family in families}
+
+    @staticmethod
+    def load_config(base_path, cfg_type, module_data, prefetch_depth=None, cancel_event=None):
+        return ConfigLoader.load_families(base_path, module_data, [cfg_type], prefetch_depth, cancel_event)[cfg_type]
+    
+class SpeculativeLoader(QObject):
+
+    prefetched = pyqtSignal(str, object)
+
+    def __init__(self, pool=None, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.path = None
+        self.future = None
+        self.cancel_event = None
+        self.started = None
+        self.claimed = None
+
+    @staticmethod
+    def _load(path, cancel_event, pool):
+        module_data = ModuleData(pool)
+        module_data.serial_number = os.path.basename(path)
+        module_data.base_module_path = path
+        try:
+            loaded = ConfigLoader.load_families(path, module_data, cancel_event=cancel_event)
+        except LoadCancelled:
+            module_data.clear()
+            return None
+        return module_data, loaded['cold'], loaded['warm']
+
+    @staticmethod
+    def _discard(future):
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            future.result()[0].clear()
+
+    @staticmethod
+    def _is_stale(module_data, started):
+        for cfg_type in module_data.families:
+            for module in module_data.get_module_by_type(cfg_type).values():
+                try:
+                    if os.stat(module['file_path']).st_mtime > started:
+                        return True
+                except OSError:
+                    return True
+        return False
+
+    def start(self, path):
+        if path == self.path:
+            return
+        self.cancel()
+        self.path = path
+        self.started = time.time()
+        self.cancel_event = threading.Event()
+        self.future = self.executor.submit(SpeculativeLoader._load, path, self.cancel_event, self.pool)
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        if self.future is not None:
+            self.future.add_done_callback(SpeculativeLoader._discard)
+        self.path = None
+        self.future = None
+        self.cancel_event = None
+        self.claimed = None
+
+    def claim(self, path):
+        if path != self.path or self.future is None or self.future.done():
+            return False
+        if self.claimed is not self.future:
+            self.claimed = self.future
+            self.future.add_done_callback(lambda f: self.prefetched.emit(path, f))
+        return True
+
+    def owns(self, future):
+        return future is self.claimed
+
+    def take(self, path):
+        if path != self.path or self.future is None or not self.future.done():
+            self.cancel()
+            return None
+        
+        future, started = self.future, self.started
+        self.path = None
+        self.future = None
+        self.cancel_event = None
+        self.claimed = None
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Speculative load of {path} failed: {str(e)}")
+            return None
+        
+        if result is None:
+            return None
+        if SpeculativeLoader._is_stale(result[0], started):
+            result[0].clear()
+            return None
+        return result
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LiveReloader:
+
+    @staticmethod
+    def watched_files(module_data):
+        return [(cfg_type, chipID, module['file_path'], module_data.file_signatures.get(module['file_path']))
+                for cfg_type in module_data.families
+                for chipID, module in module_data.get_module_by_type(cfg_type).items()]
+
+    @staticmethod
+    def scan(files):
+        changes = []
+        
+        for cfg_type, chipID, path, old in files:
+            try:
+                st = os.stat(path)
+                if old and (st.st_mtime_ns, st.st_size) == old[:2]:
+                    continue
+                buffer = ConfigIO.read_bytes(path)
+            except OSError:
+                continue
+            
+            signature = (st.st_mtime_ns, st.st_size, hashlib.sha1(buffer).hexdigest())
+            chip_data = None
+            if not old or signature[2] != old[2]:
+                try:
+                    chip_data = JsonCodec.loads(buffer)
+                except ValueError as e:
+                    print(f"Skipping {path}: {str(e)}")
+                    continue
+            changes.append((cfg_type, chipID, path, signature, chip_data))
+        
+        return changes
+
+    @staticmethod
+    def find_changes(module_data):
+        return LiveReloader.scan(LiveReloader.watched_files(module_data))
+
+    @staticmethod
+    def _has_pixel_edits(module_data, chipID, cfg_type):
+        return f"{chipID}_PixelConfig_{cfg_type}" in module_data.pixel_edits
+
+    @staticmethod
+    def _merge_chip(module_data, cfg_type, chipID, chip_data, updated, conflicts):
+        modules = module_data.get_module_by_type(cfg_type)
+        store = module_data.get_params_by_type(cfg_type)
+        baseline = module_data.baseline_params.get(cfg_type)
+        module = modules[chipID]
+        resolved = [module_data.conflicts.pop(key) for key, conflict in list(module_data.conflicts.items())
+                    if conflict['chipID'] == chipID and conflict['type'] == cfg_type]
+        
+        for param, external in ConfigLoader.extract_important(chip_data).items():
+            key = f"{chipID}_{param}_{cfg_type}"
+            original = baseline.get(chipID, param) if baseline is not None else ParameterStore.MISSING
+            
+            if key in module_data.modified_data:
+                local = store.get(chipID, param)
+                if external != original and external != local:
+                    module_data.conflicts[key] = {
+                        'chipID': chipID, 'param': param, 'type': cfg_type,
+                        'local': local, 'external': external
+                    }
+                    conflicts.append(key)
+            elif store.get(chipID, param) != external:
+                store.set(chipID, param, external)
+                updated.append((chipID, param))
+            
+            if baseline is not None and chipID in baseline:
+                baseline.set(chipID, param, external)
+        
+        chip_type = ConfigLoader.get_chip_type(chip_data)
+        old_type = ConfigLoader.get_chip_type(module['full_data'])
+        if chip_type and old_type and LiveReloader._has_pixel_edits(module_data, chipID, cfg_type):
+            external_pixels = chip_data[chip_type].get('PixelConfig', [])
+            local_pixels = module['full_data'][old_type].get('PixelConfig', [])
+            if json.dumps(external_pixels) != json.dumps(local_pixels):
+                key = f"{chipID}_PixelConfig_{cfg_type}"
+                module_data.conflicts[key] = {
+                    'chipID': chipID, 'param': 'PixelConfig', 'type': cfg_type,
+                    'local': "local pixel edits kept", 'external': "pixel configuration changed on disk"
+                }
+                conflicts.append(key)
+            chip_data[chip_type]['PixelConfig'] = local_pixels
+        
+        updated.extend((chipID, conflict['param']) for conflict in resolved
+                       if f"{chipID}_{conflict['param']}_{cfg_type}" not in module_data.conflicts)
+        
+        module_data.release_pixel_arrays(module)
+        module['full_data'] = chip_data
+        module_data.share_pixel_arrays(module)
+
+    @staticmethod
+    def merge(module_data, changes):
+        updated = []
+        conflicts = []
+        
+        for cfg_type, chipID, path, signature, chip_data in changes:
+            if chipID not in module_data.get_module_by_type(cfg_type):
+                continue
+            if chip_data is not None:
+                LiveReloader._merge_chip(module_data, cfg_type, chipID, chip_data, updated, conflicts)
+            module_data.file_signatures[path] = signature
+        
+        return updated, conflicts
+
+
+class SessionSnapshot:
+
+    PATH = os.path.join(os.path.expanduser("~"), ".atlas_gui", "session" + BinaryConfig.EXTENSION)
+    VERSION = 2
+
+    @staticmethod
+    def _store_rows(store):
+        return {chipID: dict(store.row(chipID)) for chipID in store.chip_ids}
+
+    @staticmethod
+    def _family(module_data, cfg_type, include_pixels):
+        modules = {}
+        for chipID, module in module_data.get_module_by_type(cfg_type).items():
+            keep = include_pixels or LiveReloader._has_pixel_edits(module_data, chipID, cfg_type)
+            modules[chipID] = {
+                'file_path': module['file_path'],
+                'config_name': module['config_name'],
+                'full_data': module['full_data'] if keep else None
+            }
+        baseline = module_data.baseline_params.get(cfg_type)
+        return {
+            'ports': module_data.get_ports_by_type(cfg_type),
+            'params': SessionSnapshot._store_rows(module_data.get_params_by_type(cfg_type)),
+            'baseline': SessionSnapshot._store_rows(baseline) if baseline is not None else None,
+            'modules': modules
+        }
+
+    @staticmethod
+    def _module_document(module_data, include_pixels):
+        return {
+            'serial_number': module_data.serial_number,
+            'base_module_path': module_data.base_module_path,
+            'file_saved': module_data.file_saved,
+            'file_signatures': {key: list(sig) for key, sig in module_data.file_signatures.items()},
+            'modified_data': module_data.modified_data,
+            'pixel_edits': module_data.pixel_edits,
+            'unsaved': sorted(module_data.unsaved),
+            'conflicts': module_data.conflicts,
+            'families': {cfg_type: SessionSnapshot._family(module_data, cfg_type, include_pixels)
+                         for cfg_type in module_data.families}
+        }
+
+    @staticmethod
+    def write(module_datas, path=None, include_pixels=False, active=None):
+        path = path or SessionSnapshot.PATH
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        document = {
+            'session_version': SessionSnapshot.VERSION,
+            'saved_at': time.time(),
+            'active': active,
+            'modules': [SessionSnapshot._module_document(module_data, include_pixels) for module_data in module_datas]
+        }
+        return BinaryConfig.write(path, document)
+
+    @staticmethod
+    def exists(path=None):
+        return os.path.exists(path or SessionSnapshot.PATH)
+
+    @staticmethod
+    def discard(path=None):
+        try:
+            os.remove(path or SessionSnapshot.PATH)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def read(path=None):
+        try:
+            document = BinaryConfig.load(path or SessionSnapshot.PATH)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring session snapshot: {str(e)}")
+            return None
+        if document.get('session_version') != SessionSnapshot.VERSION:
+            return None
+        return document
+
+    @staticmethod
+    def _restore_family(module_data, cfg_type, family):
+        module_data.get_ports_by_type(cfg_type).update(family['ports'])
+        modules = module_data.get_module_by_type(cfg_type)
+        
+        for chipID, entry in family['modules'].items():
+            full_data = entry['full_data']
+            if full_data is None:
+                payload = ConfigLoader._read_chip_payload(entry['file_path'])
+                full_data = ConfigLoader._decode_chip_payload(payload)
+            modules[chipID] = {
+                'full_data': full_data,
+                'important_data': family['params'].get(chipID, {}),
+                'file_path': entry['file_path'],
+                'config_name': entry['config_name']
+            }
+            module_data.register_module(cfg_type, chipID)
+        
+        if family['baseline'] is not None:
+            baseline = ParameterStore()
+            for chipID, values in family['baseline'].items():
+                baseline.add_chip(chipID, values)
+            module_data.baseline_params[cfg_type] = baseline
+
+    @staticmethod
+    def restore(path=None, pool=None, document=None):
+        document = document or SessionSnapshot.read(path)
+        if document is None:
+            return []
+        modules = [SessionSnapshot.restore_module(entry, pool) for entry in document['modules']]
+        return [module_data for module_data in modules if module_data is not None]
+
+    @staticmethod
+    def restore_module(document, pool=None):
+        start = time.perf_counter()
+        module_data = ModuleData(pool, families=list(document['families']))
+        module_data.serial_number = document['serial_number']
+        module_data.base_module_path = document['base_module_path']
+        module_data.file_saved = document['file_saved']
+        module_data.file_signatures.update({key: tuple(sig) for key, sig in document['file_signatures'].items()})
+        module_data.modified_data.update(document['modified_data'])
+        module_data.pixel_edits.update(document.get('pixel_edits', {}))
+        module_data.unsaved.update(document.get('unsaved', document['modified_data']))
+        module_data.conflicts.update(document['conflicts'])
+        
+        try:
+            for cfg_type, family in document['families'].items():
+                SessionSnapshot._restore_family(module_data, cfg_type, family)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Cannot restore session for {module_data.serial_number}: {str(e)}")
+            module_data.clear()
+            return None
+        
+        module_data.build_connectivity()
+        changes = LiveReloader.find_changes(module_data)
+        if changes:
+            LiveReloader.merge(module_data, changes)
+        module_data.load_stats.wall_time = time.perf_counter() - start
+        return module_data
+
+
+class FleetCache:
+
+    FIELDS = ['module', 'type', 'chip', 'chipID', 'path']
+
+    def __init__(self, base_directory, params):
+        self.base_directory = base_directory
+        self.params = list(params)
+        self.signatures = {}
+        self.rows = {field: [] for field in FleetCache.FIELDS}
+        self.columns = {param: array('d') for param in self.params}
+
+    def __len__(self):
+        return len(self.rows['path'])
+
+    def add_row(self, module, cfg_type, path, signature, chip, chipID, values):
+        for field, value in zip(FleetCache.FIELDS, (module, cfg_type, chip, chipID, path)):
+            self.rows[field].append(value)
+        for param, value in zip(self.params, values):
+            self.columns[param].append(value)
+        self.signatures[path] = signature
+
+    def row_values(self, index):
+        return [self.columns[param][index] for param in self.params]
+
+    def labels(self, indices):
+        return [f"{self.rows['module'][i]} {self.rows['chip'][i]} (ChipID {self.rows['chipID'][i]}, "
+                f"{self.rows['type'][i]})" for i in indices]
+
+    def series(self, param, cfg_type):
+        indices = [i for i, t in enumerate(self.rows['type']) if t == cfg_type]
+        column = self.columns[param]
+        return [column[i] for i in indices], self.labels(indices)
+
+    def deltas(self, param):
+        warm = {(self.rows['module'][i], self.rows['chip'][i]): i
+                for i, t in enumerate(self.rows['type']) if t == "warm"}
+        column = self.columns[param]
+        values, labels = [], []
+        for i, t in enumerate(self.rows['type']):
+            j = warm.get((self.rows['module'][i], self.rows['chip'][i]))
+            if t == "cold" and j is not None:
+                values.append(column[i] - column[j])
+                labels.append(f"{self.rows['module'][i]} {self.rows['chip'][i]} (ChipID {self.rows['chipID'][i]})")
+        return values, labels
+
+    def to_document(self):
+        return {
+            'version': FleetStatistics.CACHE_VERSION,
+            'base_directory': self.base_directory,
+            'params': self.params,
+            'signatures': self.signatures,
+            'rows': self.rows,
+            'columns': {param: column.tolist() for param, column in self.columns.items()}
+        }
+
+    @staticmethod
+    def from_document(document):
+        cache = FleetCache(document['base_directory'], document['params'])
+        cache.signatures = {path: list(sig) for path, sig in document['signatures'].items()}
+        cache.rows = {field: list(document['rows'][field]) for field in FleetCache.FIELDS}
+        cache.columns = {param: array('d', document['columns'][param]) for param in cache.params}
+        return cache
+
+
+class FleetStatistics:
+
+    PARAMS = ["KSenseInA", "KSenseInD", "KSenseShuntA", "KSenseShuntD",
+              "SldoTrimA", "SldoTrimD", "ADCcalPar0", "ADCcalPar1", "ADCcalPar2"]
+    CACHE_VERSION = 1
+    PERCENTILES = [1, 5, 25, 50, 75, 95, 99]
+    MAD_THRESHOLD = 3.5
+    PARALLEL_THRESHOLD = 64
+    HISTOGRAM_WIDTH = 40
+
+    @staticmethod
+    def cache_path(base_directory):
+        digest = hashlib.sha1(os.path.abspath(base_directory).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(os.path.dirname(SessionSnapshot.PATH), f"stats_{digest}{BinaryConfig.EXTENSION}")
+
+    @staticmethod
+    def find_chip_files(base_directory):
+        for name in sorted(os.listdir(base_directory)):
+            module_path = os.path.join(base_directory, name)
+            if name.endswith("_modified") or not os.path.isdir(module_path):
+                continue
+            for cfg_type in ModuleData.FAMILIES:
+                cfg_path = os.path.join(module_path, f"L2_{cfg_type}")
+                if not os.path.isdir(cfg_path):
+                    continue
+                for f in sorted(os.listdir(cfg_path)):
+                    match = ConfigLoader.CHIP_FILE_PATTERN.match(f)
+                    if match and match.group('family').lower() == cfg_type.lower():
+                        yield name, cfg_type, os.path.join(cfg_path, f)
+
+    @staticmethod
+    def _numeric(value):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return math.nan
+
+    @staticmethod
+    def extract_row(path):
+        chip_data = ConfigLoader._decode_chip_payload(ConfigLoader._read_chip_payload(path))
+        chip_type = ConfigLoader.get_chip_type(chip_data)
+        if chip_type is None:
+            raise ValueError("not a chip configuration")
+        parameter = chip_data[chip_type].get('Parameter', {})
+        important = ConfigLoader.extract_important(chip_data)
+        
+        values = []
+        for param in FleetStatistics.PARAMS:
+            if param.startswith("ADCcalPar"):
+                calibration = important.get("ADCcalPar")
+                index = int(param[len("ADCcalPar"):])
+                value = calibration[index] if isinstance(calibration, list) and len(calibration) > index else None
+            else:
+                value = important.get(param)
+            values.append(FleetStatistics._numeric(value))
+        
+        chip = str(parameter.get('Name', os.path.basename(ConfigIO.strip_suffix(path))))
+        return chip, str(parameter.get('ChipId', 'N/A')), values
+
+    @staticmethod
+    def _try_extract_row(path):
+        try:
+            return FleetStatistics.extract_row(path), None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            return None, f"{type(e).__name__}: {str(e)}"
+
+    @staticmethod
+    def _read_cache(base_directory):
+        path = FleetStatistics.cache_path(base_directory)
+        if not os.path.exists(path):
+            return None
+        try:
+            document = BinaryConfig.load(path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring statistics cache {path}: {str(e)}")
+            return None
+        if (document.get('version') != FleetStatistics.CACHE_VERSION or
+                document.get('params') != FleetStatistics.PARAMS):
+            return None
+        return FleetCache.from_document(document)
+
+    @staticmethod
+    def load(base_directory, rebuild=False, workers=None):
+        base_directory = os.path.abspath(base_directory)
+        old = None if rebuild else FleetStatistics._read_cache(base_directory)
+        old_index = {path: i for i, path in enumerate(old.rows['path'])} if old else {}
+        
+        entries = []
+        pending = []
+        for module, cfg_type, path in FleetStatistics.find_chip_files(base_directory):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            signature = [st.st_mtime_ns, st.st_size]
+            reuse = path in old_index and old.signatures.get(path) == signature
+            entries.append((module, cfg_type, path, signature, reuse))
+            if not reuse:
+                pending.append(path)
+        
+        if len(pending) >= FleetStatistics.PARALLEL_THRESHOLD and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(FleetStatistics._try_extract_row, pending, chunksize=16))
+        else:
+            results = [FleetStatistics._try_extract_row(path) for path in pending]
+        
+        parsed = {}
+        for path, (row, error) in zip(pending, results):
+            if error is not None:
+                print(f"Skipping {path}: {error}")
+            else:
+                parsed[path] = row
+        
+        cache = FleetCache(base_directory, FleetStatistics.PARAMS)
+        for module, cfg_type, path, signature, reuse in entries:
+            if reuse:
+                i = old_index[path]
+                cache.add_row(module, cfg_type, path, signature, old.rows['chip'][i],
+                              old.rows['chipID'][i], old.row_values(i))
+            elif path in parsed:
+                cache.add_row(module, cfg_type, path, signature, *parsed[path])
+        
+        if pending or old is None or len(old) != len(cache):
+            cache_path = FleetStatistics.cache_path(base_directory)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            BinaryConfig.write(cache_path, cache.to_document())
+        return cache
+
+    @staticmethod
+    def percentiles(sorted_values, points=PERCENTILES):
+        result = []
+        last = len(sorted_values) - 1
+        for p in points:
+            position = last * p / 100
+            lower = math.floor(position)
+            upper = min(lower + 1, last)
+            fraction = position - lower
+            result.append(sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction)
+        return result
+
+    @staticmethod
+    def histogram(sorted_values, bins):
+        lo, hi = sorted_values[0], sorted_values[-1]
+        counts = [0] * bins
+        if hi == lo:
+            counts[0] = len(sorted_values)
+            return lo, hi, counts
+        scale = bins / (hi - lo)
+        for value in sorted_values:
+            counts[min(int((value - lo) * scale), bins - 1)] += 1
+        return lo, hi, counts
+
+    @staticmethod
+    def mad_outliers(values, labels, threshold=MAD_THRESHOLD):
+        median = statistics.median(values)
+        mad = statistics.median([abs(v - median) for v in values])
+        if mad == 0:
+            return []
+        scored = [(label, value, 0.6745 * (value - median) / mad) for label, value in zip(labels, values)]
+        return sorted([item for item in scored if abs(item[2]) > threshold], key=lambda item: -abs(item[2]))
+
+    @staticmethod
+    def describe(values, labels, bins=20, max_outliers=10):
+        pairs = [(v, label) for v, label in zip(values, labels) if not math.isnan(v)]
+        if not pairs:
+            return ["    (no data)"]
+        values = [v for v, _ in pairs]
+        labels = [label for _, label in pairs]
+        ordered = sorted(values)
+        
+        lines = [f"    n={len(values)}  mean={statistics.fmean(values):.6g}  "
+                 f"std={statistics.pstdev(values):.6g}  min={ordered[0]:.6g}  max={ordered[-1]:.6g}"]
+        lines.append("    " + "  ".join(f"p{p}={v:.6g}" for p, v in
+                                        zip(FleetStatistics.PERCENTILES, FleetStatistics.percentiles(ordered))))
+        
+        lo, hi, counts = FleetStatistics.histogram(ordered, bins)
+        peak = max(counts)
+        width = (hi - lo) / bins
+        for i, count in enumerate(counts):
+            bar = "█" * round(FleetStatistics.HISTOGRAM_WIDTH * count / peak)
+            lines.append(f"    {lo + i * width:>14.6g} | {bar} {count}")
+            if width == 0:
+                break
+        
+        outliers = FleetStatistics.mad_outliers(values, labels)
+        if outliers:
+            lines.append(f"    ⚠️ {len(outliers)} outliers (|robust z| > {FleetStatistics.MAD_THRESHOLD}):")
+            for label, value, z in outliers[:max_outliers]:
+                lines.append(f"      • {label}: {value:.6g} (z={z:+.1f})")
+            if len(outliers) > max_outliers:
+                lines.append(f"      ... and {len(outliers) - max_outliers} more")
+        return lines
+
+    @staticmethod
+    def report(cache, params=None, bins=20):
+        modules = len(set(cache.rows['module']))
+        lines = [f"📈 Fleet statistics for {cache.base_directory}",
+                 f"   {modules} modules, {len(cache)} chip configurations", ""]
+        families = [family for family in ModuleData.FAMILIES if family in set(cache.rows['type'])]
+        for param in params or cache.params:
+            lines.append(f"=== {param} ===")
+            series = [(family.upper(), cache.series(param, family)) for family in families]
+            series.append(("COLD − WARM", cache.deltas(param)))
+            for label, (values, names) in series:
+                lines.append(f"  {label}:")
+                lines.extend(FleetStatistics.describe(values, names, bins))
+            lines.append("")
+        return lines
+
+
+class FleetExporter:
+
+    TABLE_FIELDS = ['module', 'type', 'chipID', 'config_name']
+    PENDING_PER_WORKER = 2
+
+    @staticmethod
+    def resolve_serials(base_directory, serials):
+        names = []
+        if os.path.isdir(base_directory):
+            names = sorted(name for name in os.listdir(base_directory)
+                           if not name.endswith("_modified") and os.path.isdir(os.path.join(base_directory, name)))
+        
+        paths = []
+        missing = []
+        ambiguous = {}
+        for serial in serials:
+            if os.path.isdir(serial):
+                paths.append(serial)
+                continue
+            matches = [name for name in names if name == serial] or [name for name in names if serial in name]
+            if len(matches) == 1:
+                paths.append(os.path.join(base_directory, matches[0]))
+            elif matches:
+                ambiguous[serial] = matches
+            else:
+                missing.append(serial)
+        return list(dict.fromkeys(paths)), missing, ambiguous
+
+    @staticmethod
+    def _chip_value(module_data, family, chipID, param):
+        value = module_data.get_params_by_type(family).get(chipID, param)
+        if value is not ParameterStore.MISSING:
+            return value
+        chip_data = module_data.get_module_by_type(family)[chipID]['full_data']
+        chip_type = ConfigLoader.get_chip_type(chip_data)
+        if chip_type is None:
+            return None
+        for section in ["GlobalConfig", "Parameter"]:
+            if param in chip_data[chip_type].get(section, {}):
+                return chip_data[chip_type][section][param]
+        return None
+
+    @staticmethod
+    def extract_module(path, params):
+        module_data = _load_module(path)
+        serial = os.path.basename(os.path.normpath(path))
+        if module_data is None:
+            return serial, None, []
+        
+        families = module_data.loaded_families()
+        ports = {}
+        for family in families:
+            config_paths = {chipID: os.path.abspath(module['file_path'])
+                            for chipID, module in module_data.get_module_by_type(family).items()}
+            ports[family] = {
+                port_name: [dict(chip_info, config=config_paths[chip_info['chipID']]) for chip_info in chips]
+                for port_name, chips in module_data.get_ports_by_type(family).items()
+            }
+        document = {
+            'serial': serial,
+            'path': os.path.abspath(path),
+            'ports': ports,
+            'issues': [issue._asdict() for issue in module_data.connectivity.check()]
+        }
+        
+        rows = []
+        for family in families:
+            for chipID in sorted(module_data.get_module_by_type(family)):
+                rows.append([serial, family, chipID, module_data.get_config_name(chipID)] +
+                            [FleetExporter._chip_value(module_data, family, chipID, param) for param in params])
+        
+        module_data.clear()
+        return serial, document, rows
+
+    @staticmethod
+    def iter_modules(paths, params, workers=None):
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(paths) <= 1:
+            for path in paths:
+                yield FleetExporter.extract_module(path, params)
+            return
+        
+        paths = iter(paths)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for path in itertools.islice(paths, workers * FleetExporter.PENDING_PER_WORKER):
+                pending.append(executor.submit(FleetExporter.extract_module, path, params))
+            while pending:
+                result = pending.popleft().result()
+                path = next(paths, None)
+                if path is not None:
+                    pending.append(executor.submit(FleetExporter.extract_module, path, params))
+                yield result
+
+    @staticmethod
+    def _cell(value):
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def export(paths, connectivity_path, table_path, params=None, workers=None):
+        params = list(params or ConfigLoader.IMPORTANT_PARAMS)
+        counts = {'modules': 0, 'links': 0, 'rows': 0, 'issues': 0, 'failed': []}
+        
+        with ConfigIO.open_text(connectivity_path, 'w') as connectivity, ConfigIO.open_text(table_path, 'w') as table:
+            writer = csv.writer(table, lineterminator="\n")
+            writer.writerow(FleetExporter.TABLE_FIELDS + params)
+            connectivity.write('{"exported_at": ' + json.dumps(time.strftime("%Y-%m-%d %H:%M:%S")) + ', "modules": [')
+            
+            for serial, document, rows in FleetExporter.iter_modules(paths, params, workers):
+                if document is None:
+                    print(f"Skipping {serial}: no configurations found")
+                    counts['failed'].append(serial)
+                    continue
+                connectivity.write(("\n" if counts['modules'] == 0 else ",\n") + json.dumps(document))
+                writer.writerows([FleetExporter._cell(value) for value in row] for row in rows)
+                
+                counts['modules'] += 1
+                counts['links'] += sum(len(chips) for ports in document['ports'].values() for chips in ports.values())
+                counts['rows'] += len(rows)
+                counts['issues'] += len(document['issues'])
+            
+            connectivity.write("\n]}\n")
+        return counts
+
+
+class ModuleWatcher(QObject):
+    
+    changes_ready = pyqtSignal(object, object)
+    
+    def __init__(self, parent=None, delay=500):
+        super().__init__(parent)
+        self.module_data = None
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_check)
+        self.watcher.fileChanged.connect(self.schedule_check)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.check)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+    
+    def watch(self, module_data):
+        self.stop()
+        self.module_data = module_data
+        base_path = module_data.base_module_path
+        
+        paths = [base_path] + [os.path.join(base_path, f"L2_{cfg_type}") for cfg_type in module_data.families]
+        paths += [module['file_path'] for cfg_type in module_data.families
+                  for module in module_data.get_module_by_type(cfg_type).values()]
+        self.watcher.addPaths([path for path in paths if os.path.exists(path)])
+    
+    def stop(self):
+        self.timer.stop()
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        self.module_data = None
+    
+    def schedule_check(self, path=None):
+        if self.module_data is not None:
+            self.timer.start()
+    
+    def check(self):
+        module_data = self.module_data
+        if module_data is None:
+            return
+        
+        files = LiveReloader.watched_files(module_data)
+        watched = set(self.watcher.files())
+        missing = [path for cfg_type, chipID, path, old in files if path not in watched and os.path.exists(path)]
+        if missing:
+            self.watcher.addPaths(missing)
+        
+        future = self.executor.submit(LiveReloader.scan, files)
+        future.add_done_callback(lambda f: self._emit_changes(module_data, f))
+    
+    def _emit_changes(self, module_data, future):
+        if future.exception() is not None:
+            print(f"Live reload failed: {str(future.exception())}")
+            return
+        if future.result():
+            self.changes_ready.emit(module_data, future.result())
+    
+    def shutdown(self):
+        self.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class Workspace:
+
+    def __init__(self, pool=None):
+        self.pool = pool if pool is not None else ContentPool()
+        self.modules = OrderedDict()
+        self.active = None
+
+    def __len__(self):
+        return len(self.modules)
+
+    def __contains__(self, path):
+        return os.path.abspath(path) in self.modules
+
+    def add(self, module_data, activate=True):
+        path = os.path.abspath(module_data.base_module_path or module_data.serial_number)
+        previous = self.modules.get(path)
+        if previous is not None and previous is not module_data:
+            previous.clear()
+        self.modules[path] = module_data
+        if activate:
+            self.active = path
+        return path
+
+    def get(self, path):
+        return self.modules.get(os.path.abspath(path))
+
+    def activate(self, path):
+        path = os.path.abspath(path)
+        if path not in self.modules:
+            return None
+        self.active = path
+        return self.modules[path]
+
+    def active_module(self):
+        return self.modules.get(self.active)
+
+    def remove(self, path):
+        path = os.path.abspath(path)
+        module_data = self.modules.pop(path, None)
+        if module_data is None:
+            return False
+        module_data.clear()
+        if self.active == path:
+            self.active = next(reversed(self.modules), None)
+        return True
+
+    def clear(self):
+        for module_data in self.modules.values():
+            module_data.clear()
+        self.modules.clear()
+        self.active = None
+
+    def dirty_modules(self):
+        return [module_data for module_data in self.modules.values() if module_data.has_unsaved_changes()]
+
+    def families(self):
+        loaded = set()
+        for module_data in self.modules.values():
+            loaded.update(module_data.loaded_families())
+        families = [family for family in ModuleData.FAMILIES if family in ModuleData.REQUIRED_FAMILIES or family in loaded]
+        return families + sorted(loaded.difference(families))
+
+    def parameter_names(self):
+        names = set()
+        for module_data in self.modules.values():
+            for family in module_data.families:
+                store = module_data.get_params_by_type(family)
+                names.update(param for param in store.params
+                             if any(value is not ParameterStore.MISSING for value in store.column(param)))
+        return sorted(names)
+
+    def parameter_rows(self, param):
+        rows = []
+        for module_data in self.modules.values():
+            stores = [module_data.get_params_by_type(family) for family in module_data.families]
+            for chipID in sorted(module_data.get_all_chip_ids()):
+                if any(store.get(chipID, param) is not ParameterStore.MISSING for store in stores):
+                    rows.append((module_data, chipID))
+        return rows
+
+
+class WorkspaceLoader(QObject):
+
+    module_loaded = pyqtSignal(str, object)
+
+    def __init__(self, pool=None, parent=None, workers=2):
+        super().__init__(parent)
+        self.pool = pool
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = {}
+
+    def load(self, path):
+        if path in self.pending:
+            return False
+        cancel_event = threading.Event()
+        self.pending[path] = cancel_event
+        future = self.executor.submit(SpeculativeLoader._load, path, cancel_event, self.pool)
+        future.add_done_callback(lambda f: self._emit_loaded(path, f))
+        return True
+
+    def _emit_loaded(self, path, future):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            print(f"Error loading {path} in background: {str(future.exception())}")
+            self.module_loaded.emit(path, None)
+            return
+        self.module_loaded.emit(path, future.result())
+
+    def take(self, path):
+        return self.pending.pop(path, None) is not None
+
+    def cancel(self):
+        for cancel_event in self.pending.values():
+            cancel_event.set()
+        self.pending.clear()
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class CrossModuleModel(QAbstractTableModel):
+
+    HEADERS = ["Module", "ChipID", "Config Name"]
+
+    def __init__(self, workspace, parent=None):
+        super().__init__(parent)
+        self.workspace = workspace
+        self.families = workspace.families()
+        self.param = None
+        self.rows = []
+
+    def set_parameter(self, param):
+        self.beginResetModel()
+        self.param = param
+        self.families = self.workspace.families()
+        self.rows = self.workspace.parameter_rows(param) if param else []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(CrossModuleModel.HEADERS) + len(self.families) + 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Vertical:
+            return str(section + 1)
+        headers = CrossModuleModel.HEADERS + [
+            f"{StyleConfig.family_icon(family)} {StyleConfig.family_label(family)} Value" for family in self.families
+        ] + ["Status"]
+        return headers[section] if section < len(headers) else None
+
+    def family_at(self, column):
+        index = column - len(CrossModuleModel.HEADERS)
+        return self.families[index] if 0 <= index < len(self.families) else None
+
+    def status_column(self):
+        return len(CrossModuleModel.HEADERS) + len(self.families)
+
+    def value(self, row, family):
+        module_data, chipID = self.rows[row]
+        if family not in module_data.params:
+            return ParameterStore.MISSING
+        return module_data.get_params_by_type(family).get(chipID, self.param)
+
+    def values(self, family):
+        values = [self.value(row, family) for row in range(len(self.rows))]
+        return [value for value in values if value is not ParameterStore.MISSING]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        module_data, chipID = self.rows[index.row()]
+        column = index.column()
+        family = self.family_at(column)
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return module_data.serial_number
+            if column == 1:
+                return chipID
+            if column == 2:
+                return module_data.get_config_name(chipID)
+            if family is not None:
+                value = self.value(index.row(), family)
+                return "N/A" if value is ParameterStore.MISSING else str(value)
+            return module_data.status_text(chipID, self.param) or "—"
+
+        if role == Qt.BackgroundRole:
+            if family is not None:
+                if self.value(index.row(), family) is ParameterStore.MISSING:
+                    return QColor(220, 220, 220)
+                return StyleConfig.family_colors(family)['val_bg']
+            if column == self.status_column():
+                return QColor(255, 255, 200) if module_data.status_text(chipID, self.param) else QColor(255, 255, 255)
+            return QColor(240, 240, 240)
+
+        if role == Qt.ForegroundRole and family is not None:
+            if self.value(index.row(), family) is ParameterStore.MISSING:
+                return QColor(150, 150, 150)
+            return StyleConfig.family_colors(family)['fg']
+
+        if role == Qt.TextAlignmentRole and column == self.status_column():
+            return Qt.AlignCenter
+        return None
+
+    def set_value(self, indexes, value):
+        changed = 0
+        for index in indexes:
+            family = self.family_at(index.column())
+            if family is None or self.value(index.row(), family) is ParameterStore.MISSING:
+                continue
+            module_data, chipID = self.rows[index.row()]
+            module_data.get_params_by_type(family).set(chipID, self.param, value)
+            module_data.record_modification(chipID, self.param, value, family, module_data.get_config_name(chipID))
+            self.dataChanged.emit(self.index(index.row(), 0), self.index(index.row(), self.status_column()))
+            changed += 1
+        return changed
+
+
+class PixelMaskEditor:
+
+    MASK_FIELDS = ["Enable", "Hitbus"]
+
+    @staticmethod
+    def get_pixel_config(module):
+        chip_type = ConfigLoader.get_chip_type(module['full_data'])
+        if chip_type is None:
+            return []
+        return module['full_data'][chip_type].get('PixelConfig', [])
+
+    @staticmethod
+    def _parse_coordinates(pairs):
+        mask = {}
+        for col, row in pairs:
+            mask.setdefault(int(col), set()).add(int(row))
+        return {col: tuple(sorted(rows)) for col, rows in mask.items()}
 
     @staticmethod
-    def _process_chip(base_path, chip, cfg_type, port_list, modules_dict):
-        config_file = chip.get('config', '')
-        if not config_file:
-            return
-        
-        chip_path = os.path.join(base_path, config_file)
-        if not os.path.exists(chip_path):
-            return
-        
-        with open(chip_path, 'r') as cf:
-            chip_data = json.load(cf)
-        
-        chipID, config_name = ConfigLoader._extract_chip_info(chip_data)
-        if chipID is None:
-            return
-        
-        chipID = str(chipID)
-        
-        port_list.append({
-            'chipID': chipID,
-            'config_name': config_name,
-            'rx': chip.get('rx'),
-            'tx': chip.get('tx'),
-            'enable': chip.get('enable', 1)
-        })
-        
-        if chipID not in modules_dict:
-            modules_dict[chipID] = ConfigLoader._create_module_entry(
-                chip_data, chip_path, config_file, cfg_type, config_name
-            )
+    def _parse_bitmap(bitmap):
+        mask = {}
+        for col, flags in enumerate(bitmap):
+            rows = tuple(row for row, flag in enumerate(flags) if flag)
+            if rows:
+                mask[col] = rows
+        return mask
 
     @staticmethod
-    def _load_port_file(base_path, port_file, cfg_type, port_dict, modules_dict):
-        with open(os.path.join(base_path, port_file), 'r') as f:
-            port_data = json.load(f)
-        
-        port_name = port_file.replace('.json', '')
-        port_dict[port_name] = []
-        
-        for chip in port_data.get('chips', []):
-            ConfigLoader._process_chip(base_path, chip, cfg_type, 
-                                      port_dict[port_name], modules_dict)
-    
-    
+    def _parse_text(text):
+        pairs = []
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].replace(',', ' ').split()
+            if not line:
+                continue
+            if len(line) != 2:
+                raise ValueError(f"Invalid mask line: {' '.join(line)}")
+            pairs.append(line)
+        return PixelMaskEditor._parse_coordinates(pairs)
+
     @staticmethod
-    def load_config(base_path, cfg_type, module_data):
-        config_path = os.path.join(base_path, f"L2_{cfg_type}")
-        if not os.path.exists(config_path):
-            return False
+    def load_mask(path):
+        with open(path, 'r') as f:
+            text = f.read()
+        
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return PixelMaskEditor._parse_text(text)
+        
+        if isinstance(data, dict):
+            if 'pixels' in data:
+                return PixelMaskEditor._parse_coordinates(data['pixels'])
+            if 'bitmap' in data:
+                return PixelMaskEditor._parse_bitmap(data['bitmap'])
+            raise ValueError("Mask file must contain 'pixels' or 'bitmap'")
+        
+        raise ValueError("JSON mask files must be an object with a 'pixels' or 'bitmap' list")
+
+    @staticmethod
+    def count_pixels(module, field="Enable", value=0):
+        return sum(col[field].count(value) for col in PixelMaskEditor.get_pixel_config(module))
+
+    @staticmethod
+    def apply_mask(module, mask, fields=None):
+        fields = fields or PixelMaskEditor.MASK_FIELDS
+        affected = 0
         
-        port_files = [f for f in os.listdir(base_path) 
-                     if f.endswith('.json') and cfg_type in f.lower() and 'YarrPort' in f]
+        for col in PixelMaskEditor.get_pixel_config(module):
+            rows = mask.get(col['Col'])
+            if not rows:
+                continue
+            
+            enable = col[fields[0]]
+            rows = [row for row in rows if row < len(enable)]
+            affected += sum(1 for row in rows if enable[row])
+            
+            for field in fields:
+                values = ContentPool.writable(col, field)
+                for row in rows:
+                    values[row] = 0
         
-        port_dict = module_data.get_ports_by_type(cfg_type)
-        modules_dict = module_data.get_module_by_type(cfg_type)
+        return affected
+
+    @staticmethod
+    def copy_tdac(src_module, dst_module):
+        src_tdac = {col['Col']: col['TDAC'] for col in PixelMaskEditor.get_pixel_config(src_module)}
+        changed = 0
         
-        for port_file in port_files:
-            try:
-                ConfigLoader._load_port_file(base_path, port_file, cfg_type, 
-                                            port_dict, modules_dict)
-            except Exception as e:
-                print(f"Error loading {port_file}: {str(e)}")
+        for col in PixelMaskEditor.get_pixel_config(dst_module):
+            tdac = src_tdac.get(col['Col'])
+            if tdac is None or tdac is col['TDAC']:
                 continue
+            changed += sum(1 for a, b in zip(tdac, col['TDAC']) if a != b)
+            col['TDAC'] = tdac if isinstance(tdac, tuple) else list(tdac)
         
-        return len(modules_dict) > 0
-    
+        return changed
+
+
 class FileSaver:
+    
+    JOURNAL_NAME = "edit_journal.json"
 
     @staticmethod
-    def _save_single_module(cfg_path, module):
+    def _save_single_module(cfg_path, module, write_binary=True, compression=None):
         fname = os.path.basename(module['file_path'])
-        save_path = os.path.join(cfg_path, fname)
+        save_path = ConfigIO.with_compression(os.path.join(cfg_path, fname), compression)
         
         chip_type = "ITKPIXV2" if "ITKPIXV2" in module['full_data'] else "RD53B"
         
@@ -235,141 +2869,740 @@ class FileSaver:
             elif param in module['full_data'][chip_type]['Parameter']:
                 module['full_data'][chip_type]['Parameter'][param] = value
         
-        with open(save_path, 'w') as f:
-            json.dump(module['full_data'], f, indent=4)
+        with ConfigIO.open_text(save_path, 'w') as f:
+            JsonCodec.dump(module['full_data'], f)
+        ConfigIO.remove_variants(save_path)
+        
+        sidecar = BinaryConfig.sidecar_path(save_path)
+        if write_binary and compression is None:
+            BinaryConfig.write(sidecar, module['full_data'], source_path=save_path)
+        elif os.path.exists(sidecar):
+            os.remove(sidecar)
+        return save_path
 
     @staticmethod
-    def _save_module_configs(new_path, module_data):
-        for cfg_type in ["cold", "warm"]:
+    def _save_module_configs(new_path, module_data, write_binary=True, compression=None):
+        written = []
+        for cfg_type in module_data.loaded_families():
             cfg_path = os.path.join(new_path, f"L2_{cfg_type}")
             modules = module_data.get_module_by_type(cfg_type)
             
             for chipID, module in modules.items():
-                FileSaver._save_single_module(cfg_path, module)
+                save_path = FileSaver._save_single_module(cfg_path, module, write_binary, compression)
+                written.append({'source': module['file_path'], 'output': save_path,
+                                'type': cfg_type, 'chipID': chipID})
+        return written
 
     @staticmethod
-    def _copy_port_files(source_path, dest_path):
+    def _copy_port_files(source_path, dest_path, compression=None):
+        written = []
         for f in os.listdir(source_path):
-            if f.endswith('.json') and 'YarrPort' in f:
-                with open(os.path.join(source_path, f), 'r') as sf:
-                    data = json.load(sf)
-                with open(os.path.join(dest_path, f), 'w') as df:
-                    json.dump(data, df, indent=4)
+            if ConfigLoader.PORT_FILE_PATTERN.match(f):
+                with ConfigIO.open_text(os.path.join(source_path, f)) as sf:
+                    data = JsonCodec.load(sf)
+                dest_file = ConfigIO.with_compression(os.path.join(dest_path, f), compression)
+                with ConfigIO.open_text(dest_file, 'w') as df:
+                    JsonCodec.dump(data, df)
+                ConfigIO.remove_variants(dest_file)
+                written.append({'source': os.path.join(source_path, f), 'output': dest_file,
+                                'type': None, 'chipID': None})
+        return written
+    
+    @staticmethod
+    def _write_journal(source_path, dest_path, module_data, written):
+        journal = {
+            'serial_number': module_data.serial_number,
+            'saved_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'modifications': list(module_data.modified_data.values()),
+            'pixel_edits': list(module_data.pixel_edits.values()),
+            'files': [{**entry,
+                       'source': os.path.relpath(entry['source'], source_path),
+                       'output': os.path.relpath(entry['output'], dest_path)}
+                      for entry in written]
+        }
+        with open(os.path.join(dest_path, FileSaver.JOURNAL_NAME), 'w') as f:
+            json.dump(journal, f, indent=4)
     
     @staticmethod
-    def save_changes(module_data):
+    def save_changes(module_data, write_binary=True, compression=None):
         if not module_data.base_module_path:
             raise ValueError("Nessun percorso base modulo definito")
         
         new_path = module_data.base_module_path + "_modified"
         os.makedirs(new_path, exist_ok=True)
         
-        for folder in ["L2_cold", "L2_warm"]:
-            os.makedirs(os.path.join(new_path, folder), exist_ok=True)
+        for cfg_type in module_data.loaded_families():
+            os.makedirs(os.path.join(new_path, f"L2_{cfg_type}"), exist_ok=True)
         
-        FileSaver._save_module_configs(new_path, module_data)
+        written = FileSaver._save_module_configs(new_path, module_data, write_binary, compression)
         
-        FileSaver._copy_port_files(module_data.base_module_path, new_path)
+        written += FileSaver._copy_port_files(module_data.base_module_path, new_path, compression)
+        
+        FileSaver._write_journal(module_data.base_module_path, new_path, module_data, written)
         
         module_data.file_saved = new_path
+        module_data.mark_saved()
         return new_path
       
+RoundTripIssue = namedtuple('RoundTripIssue', ['file', 'path', 'detail'])
+
+
+class JsonStreamHasher:
+
+    WHITESPACE = str.maketrans('', '', ' \t\n\r')
+    STRING_STEP = re.compile(r'\\.|"', re.S)
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self):
+        self.raw = hashlib.sha1()
+        self.minified = hashlib.sha1()
+        self.in_string = False
+        self.carry = ""
+
+    def update(self, text):
+        self.raw.update(text.encode('utf-8'))
+        text = self.carry + text
+        self.carry = ""
+        pieces = []
+        pos = 0
+        
+        while pos < len(text):
+            if not self.in_string:
+                quote = text.find('"', pos)
+                if quote < 0:
+                    pieces.append(text[pos:].translate(JsonStreamHasher.WHITESPACE))
+                    break
+                pieces.append(text[pos:quote].translate(JsonStreamHasher.WHITESPACE))
+                pieces.append('"')
+                pos = quote + 1
+                self.in_string = True
+                continue
+            
+            end = None
+            last = pos
+            for match in JsonStreamHasher.STRING_STEP.finditer(text, pos):
+                last = match.end()
+                if match.group() == '"':
+                    end = last
+                    break
+            if end is not None:
+                pieces.append(text[pos:end])
+                pos = end
+                self.in_string = False
+            elif text.endswith('\\') and last < len(text):
+                pieces.append(text[pos:-1])
+                self.carry = '\\'
+                break
+            else:
+                pieces.append(text[pos:])
+                break
+        
+        self.minified.update("".join(pieces).encode('utf-8'))
+
+    @staticmethod
+    def hash_file(path):
+        hasher = JsonStreamHasher()
+        with ConfigIO.open_text(path) as f:
+            for chunk in iter(lambda: f.read(JsonStreamHasher.CHUNK_SIZE), ""):
+                hasher.update(chunk)
+        return hasher.raw.hexdigest(), hasher.minified.hexdigest()
+
+
+class RoundTripVerifier:
+
+    MAX_ISSUES_PER_FILE = 50
+
+    @staticmethod
+    def find_pairs(paths):
+        pairs = []
+        for path in paths:
+            path = os.path.abspath(path.rstrip(os.sep))
+            if path.endswith("_modified"):
+                pairs.append((path[:-len("_modified")], path))
+            elif os.path.isdir(path + "_modified"):
+                pairs.append((path, path + "_modified"))
+            elif os.path.isdir(path):
+                for name in sorted(os.listdir(path)):
+                    source = os.path.join(path, name)
+                    if not name.endswith("_modified") and os.path.isdir(source + "_modified"):
+                        pairs.append((source, source + "_modified"))
+        return pairs
+
+    @staticmethod
+    def _allowed_paths(chip_data, modifications, pixel_edits, chipID, cfg_type):
+        chip_type = ConfigLoader.get_chip_type(chip_data)
+        allowed = set()
+        prefixes = []
+        if chip_type is None:
+            return allowed, prefixes
+        for mod in modifications:
+            if mod['chipID'] == chipID and mod['type'] == cfg_type:
+                allowed.add(f"{chip_type}/GlobalConfig/{mod['param']}")
+                allowed.add(f"{chip_type}/Parameter/{mod['param']}")
+        if any(edit['chipID'] == chipID and edit['type'] == cfg_type for edit in pixel_edits):
+            prefixes.append(f"{chip_type}/PixelConfig/")
+        return allowed, prefixes
+
+    @staticmethod
+    def _diff(original, output, path, out):
+        if type(original) is type(output) and original == output:
+            return
+        if isinstance(original, dict) and isinstance(output, dict):
+            for key in list(dict.fromkeys(list(original) + list(output))):
+                child = f"{path}/{key}" if path else str(key)
+                if key not in output:
+                    out.append((child, "missing in output"))
+                elif key not in original:
+                    out.append((child, "added in output"))
+                else:
+                    RoundTripVerifier._diff(original[key], output[key], child, out)
+            if [k for k in original if k in output] != [k for k in output if k in original]:
+                out.append((path, "key order changed"))
+            return
+        if isinstance(original, list) and isinstance(output, list) and len(original) == len(output):
+            if all(not isinstance(v, (dict, list)) for v in original):
+                changed = sum(1 for a, b in zip(original, output) if type(a) is not type(b) or a != b)
+                out.append((path, f"{changed} of {len(original)} elements differ"))
+                return
+            for i, (a, b) in enumerate(zip(original, output)):
+                RoundTripVerifier._diff(a, b, f"{path}/{i}", out)
+            return
+        out.append((path, f"{original!r} -> {output!r}"[:120]))
+
+    @staticmethod
+    def _verify_file(source, output, entry, journal, counts, issues):
+        name = os.path.relpath(output, os.path.dirname(os.path.dirname(output)))
+        if not os.path.exists(source):
+            issues.append(RoundTripIssue(name, "", "original file not found"))
+            return
+        if not os.path.exists(output):
+            issues.append(RoundTripIssue(name, "", "output file not found"))
+            return
+        
+        source_raw, source_min = JsonStreamHasher.hash_file(source)
+        output_raw, output_min = JsonStreamHasher.hash_file(output)
+        if source_raw == output_raw:
+            counts['identical'] += 1
+            return
+        if source_min == output_min:
+            counts['reformatted'] += 1
+            return
+        
+        with ConfigIO.open_text(source) as f:
+            original = JsonCodec.load(f)
+        with ConfigIO.open_text(output) as f:
+            written = JsonCodec.load(f)
+        
+        differences = []
+        RoundTripVerifier._diff(original, written, "", differences)
+        allowed, prefixes = RoundTripVerifier._allowed_paths(original, journal['modifications'],
+                                                             journal.get('pixel_edits', []),
+                                                             entry['chipID'], entry['type'])
+        
+        unexpected = [(path, detail) for path, detail in differences
+                      if path not in allowed and not any(path.startswith(p) for p in prefixes)]
+        if not differences:
+            counts['reformatted'] += 1
+        elif not unexpected:
+            counts['edited'] += 1
+        for path, detail in unexpected[:RoundTripVerifier.MAX_ISSUES_PER_FILE]:
+            issues.append(RoundTripIssue(name, path, detail))
+        if len(unexpected) > RoundTripVerifier.MAX_ISSUES_PER_FILE:
+            issues.append(RoundTripIssue(name, "", f"{len(unexpected) - RoundTripVerifier.MAX_ISSUES_PER_FILE} more differences"))
+
+    @staticmethod
+    def verify_module(pair):
+        source_path, output_path = pair
+        counts = {'files': 0, 'identical': 0, 'reformatted': 0, 'edited': 0}
+        issues = []
+        
+        journal_path = os.path.join(output_path, FileSaver.JOURNAL_NAME)
+        try:
+            with open(journal_path) as f:
+                journal = json.load(f)
+        except (OSError, ValueError) as e:
+            issues.append(RoundTripIssue(FileSaver.JOURNAL_NAME, "", f"edit journal unavailable: {str(e)}"))
+            return source_path, counts, issues
+        
+        for entry in journal['files']:
+            counts['files'] += 1
+            try:
+                RoundTripVerifier._verify_file(os.path.join(source_path, entry['source']),
+                                               os.path.join(output_path, entry['output']),
+                                               entry, journal, counts, issues)
+            except (OSError, ValueError) as e:
+                issues.append(RoundTripIssue(entry['output'], "", str(e)))
+        
+        for f in os.listdir(source_path):
+            if ConfigLoader.PORT_FILE_PATTERN.match(f):
+                if not any(os.path.basename(ConfigIO.strip_suffix(entry['source'])) == ConfigIO.strip_suffix(f)
+                           for entry in journal['files']):
+                    issues.append(RoundTripIssue(f, "", "port file not written to output"))
+        
+        return source_path, counts, issues
+
+    @staticmethod
+    def verify(pairs, workers=None):
+        if len(pairs) <= 1 or workers == 1:
+            return [RoundTripVerifier.verify_module(pair) for pair in pairs]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(RoundTripVerifier.verify_module, pairs))
+
+    @staticmethod
+    def format_report(results):
+        lines = []
+        for source_path, counts, issues in results:
+            status = "✅" if not issues else "❌"
+            lines.append(f"{status} {os.path.basename(source_path)}: {counts['files']} files "
+                         f"({counts['identical']} identical, {counts['reformatted']} reformatted, "
+                         f"{counts['edited']} edited as journaled)")
+            for issue in issues:
+                location = f"{issue.file}:{issue.path}" if issue.path else issue.file
+                lines.append(f"    • {location} {issue.detail}")
+        return lines
+
+
+class SummaryCache:
+
+    def __init__(self):
+        self.sections = {}
+
+    def get(self, name, key, produce):
+        cached = self.sections.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        lines = list(produce())
+        self.sections[name] = (key, lines)
+        return lines
+
+    def clear(self):
+        self.sections.clear()
+
+
 class SummaryBuilder:
+    
+    EXPORT_FORMATS = ['txt', 'csv', 'json']
+    CSV_FIELDS = ['section', 'type', 'port', 'chipID', 'config_name', 'param', 'value', 'rx', 'tx', 'enable']
        
     @staticmethod
-    def _add_statistics(lines, module_data):
-        lines.append("📊 General Statistics:")
-        lines.append(f"  • Total cold modules: {len(module_data.cold_modules)}")
-        lines.append(f"  • Total warm modules: {len(module_data.warm_modules)}")
-        lines.append(f"  • Total modifications: {len(module_data.modified_data)}")
-        lines.append("")
+    def _families(module_data):
+        return module_data.display_families()
     
     @staticmethod
-    def _add_connectivity(lines, module_data):
-        lines.append("🔌 Connectivity Information (Port Assignments):")
-        lines.append("")
+    def _iter_statistics(module_data):
+        differences = sum(len(module_data.cold_params.compare(module_data.warm_params, param))
+                          for param in module_data.cold_params.params)
+        
+        yield "📊 General Statistics:"
+        for cfg_type in SummaryBuilder._families(module_data):
+            yield f"  • Total {cfg_type} modules: {len(module_data.get_params_by_type(cfg_type))}"
+        yield f"  • Parameters differing between cold and warm: {differences}"
+        yield f"  • Total modifications: {len(module_data.modified_data)}"
+        yield f"  • Chips with pixel edits: {len(module_data.pixel_edits)}"
+        yield ""
+    
+    @staticmethod
+    def _iter_connectivity(module_data):
+        yield "🔌 Connectivity Information (Port Assignments):"
+        yield ""
         
-        for cfg_type, label in [("cold", "COLD"), ("warm", "WARM")]:
-            lines.append(f"  {label} Configuration:")
+        for cfg_type in SummaryBuilder._families(module_data):
+            yield f"  {cfg_type.upper()} Configuration:"
             ports = module_data.get_ports_by_type(cfg_type)
             
             for port_name, chips in ports.items():
-                lines.append(f"    {port_name}:")
+                yield f"    {port_name}:"
                 for chip_info in chips:
                     status = "✓ Enabled" if chip_info['enable'] else "✗ Disabled"
                     cfg_name = chip_info.get('config_name', 'N/A')
-                    lines.append(f"      • Config: {cfg_name} (ChipID {chip_info['chipID']}): "
-                               f"RX={chip_info['rx']}, TX={chip_info['tx']} [{status}]")
-            lines.append("")
+                    yield (f"      • Config: {cfg_name} (ChipID {chip_info['chipID']}): "
+                           f"RX={chip_info['rx']}, TX={chip_info['tx']} [{status}]")
+            yield ""
+        
+        yield from ConnectivityIndex.format_report(module_data.connectivity.check())
+        yield ""
     
     @staticmethod
-    def _add_modifications(lines, module_data):
-        lines.append("=" * 80)
+    def _iter_modifications(module_data):
+        yield "=" * 80
         
-        if module_data.modified_data:
-            lines.append("✏️ Modified Parameters:")
-            lines.append("")
+        if module_data.has_edits():
+            yield "✏️ Modified Parameters:"
+            yield ""
             
             for key, mod in module_data.modified_data.items():
                 cfg_name = mod.get('config_name', 'N/A')
-                lines.append(f"  • {mod['type'].upper()} - Config: {cfg_name} "
-                           f"(ChipID {mod['chipID']}): {mod['param']} = {mod['value']}")
+                yield (f"  • {mod['type'].upper()} - Config: {cfg_name} "
+                       f"(ChipID {mod['chipID']}): {mod['param']} = {mod['value']}")
+            for key, edit in module_data.pixel_edits.items():
+                yield (f"  • {edit['type'].upper()} - Config: {edit['config_name']} "
+                       f"(ChipID {edit['chipID']}): PixelConfig {ModuleData.describe_pixel_edit(edit)}")
         else:
-            lines.append("ℹ️ No parameters were modified")
-            lines.append("")
+            yield "ℹ️ No parameters were modified"
+            yield ""
     
     @staticmethod
-    def _add_all_parameters(lines, module_data):
-        lines.append("=" * 80)
-        lines.append("📝 All Parameters by Chip:")
-        lines.append("")
+    def _iter_chip_parameters(module_data, chipID):
+        yield f"  ChipID {chipID}:"
+        yield f"    Config Name: {module_data.get_config_name(chipID)}"
         
-        all_chips = module_data.get_all_chip_ids()
-        
-        for chipID in sorted(all_chips):
-            lines.append(f"  ChipID {chipID}:")
-            
-            if chipID in module_data.cold_modules:
-                cfg_name = module_data.cold_modules[chipID].get('config_name', 'N/A')
-                lines.append(f"    Config Name: {cfg_name}")
-                lines.append("    Cold Parameters:")
-                for param, value in sorted(module_data.cold_modules[chipID]['important_data'].items()):
-                    lines.append(f"      • {param}: {value}")
-            
-            if chipID in module_data.warm_modules:
-                cfg_name = module_data.warm_modules[chipID].get('config_name', 'N/A')
-                if chipID not in module_data.cold_modules:
-                    lines.append(f"    Config Name: {cfg_name}")
-                lines.append("    Warm Parameters:")
-                for param, value in sorted(module_data.warm_modules[chipID]['important_data'].items()):
-                    lines.append(f"      • {param}: {value}")
-            lines.append("")
+        for cfg_type in SummaryBuilder._families(module_data):
+            store = module_data.get_params_by_type(cfg_type)
+            if chipID not in store:
+                continue
+            yield f"    {StyleConfig.family_label(cfg_type)} Parameters:"
+            for param in sorted(store.chip_params(chipID)):
+                yield f"      • {param}: {store.get(chipID, param)}"
+        yield ""
     
     @staticmethod
-    def _add_footer(lines, module_data):
-        lines.append("=" * 80)
+    def _iter_all_parameters(module_data, cache=None):
+        yield "=" * 80
+        yield "📝 All Parameters by Chip:"
+        yield ""
+        
+        stores = [module_data.get_params_by_type(cfg_type) for cfg_type in SummaryBuilder._families(module_data)]
+        for chipID in sorted(module_data.get_all_chip_ids()):
+            if cache is None:
+                yield from SummaryBuilder._iter_chip_parameters(module_data, chipID)
+                continue
+            key = (tuple((store.epoch, store.row_revision(chipID)) for store in stores),
+                   module_data.get_config_name(chipID))
+            yield from cache.get(f"chip:{chipID}", key,
+                                 lambda: SummaryBuilder._iter_chip_parameters(module_data, chipID))
+    
+    @staticmethod
+    def _iter_footer(module_data):
+        yield "=" * 80
         if module_data.file_saved:
-            lines.append(f"💾 Files saved to: {module_data.file_saved}")
+            yield f"💾 Files saved to: {module_data.file_saved}"
+        else:
+            yield "⚠️ Changes not saved to disk yet"
+        yield ""
+        yield "=" * 80
+        yield "✅ Summary generated successfully"
+
+    @staticmethod
+    def iter_summary(module_data, cache=None):
+        yield f"📋 Configuration Summary for Module: {module_data.serial_number}"
+        yield "=" * 80
+        yield ""
+        
+        stores = [module_data.get_params_by_type(cfg_type) for cfg_type in SummaryBuilder._families(module_data)]
+        if cache is None:
+            yield from SummaryBuilder._iter_statistics(module_data)
+            yield from SummaryBuilder._iter_connectivity(module_data)
         else:
-            lines.append("⚠️ Changes not saved to disk yet")
-        lines.append("")
-        lines.append("=" * 80)
-        lines.append("✅ Summary generated successfully")
+            yield from cache.get('statistics',
+                                 (tuple((store.epoch, store.revision) for store in stores),
+                                  len(module_data.modified_data), len(module_data.pixel_edits)),
+                                 lambda: SummaryBuilder._iter_statistics(module_data))
+            yield from cache.get('connectivity', tuple(store.epoch for store in stores),
+                                 lambda: SummaryBuilder._iter_connectivity(module_data))
+        yield from SummaryBuilder._iter_modifications(module_data)
+        yield from SummaryBuilder._iter_all_parameters(module_data, cache)
+        yield from SummaryBuilder._iter_footer(module_data)
 
     @staticmethod
     def build_summary(module_data):
-        lines = []
-        lines.append(f"📋 Configuration Summary for Module: {module_data.serial_number}")
-        lines.append("=" * 80)
-        lines.append("")
+        return "\n".join(SummaryBuilder.iter_summary(module_data))
+
+    @staticmethod
+    def iter_records(module_data):
+        for cfg_type in module_data.loaded_families():
+            for port_name, chips in module_data.get_ports_by_type(cfg_type).items():
+                for chip_info in chips:
+                    yield {'section': 'connectivity', 'type': cfg_type, 'port': port_name,
+                           'chipID': chip_info['chipID'], 'config_name': chip_info.get('config_name', 'N/A'),
+                           'rx': chip_info['rx'], 'tx': chip_info['tx'], 'enable': chip_info['enable']}
+        
+        for mod in module_data.modified_data.values():
+            yield {'section': 'modification', 'type': mod['type'], 'chipID': mod['chipID'],
+                   'config_name': mod.get('config_name', 'N/A'), 'param': mod['param'], 'value': mod['value']}
+        
+        for edit in module_data.pixel_edits.values():
+            for op in edit['operations']:
+                yield {'section': 'pixel_edit', 'type': edit['type'], 'chipID': edit['chipID'],
+                       'config_name': edit['config_name'], 'param': f"PixelConfig/{'/'.join(op['fields'])}",
+                       'value': op['pixels']}
+        
+        for chipID in sorted(module_data.get_all_chip_ids()):
+            config_name = module_data.get_config_name(chipID)
+            for cfg_type in module_data.loaded_families():
+                store = module_data.get_params_by_type(cfg_type)
+                if chipID not in store:
+                    continue
+                for param in sorted(store.chip_params(chipID)):
+                    yield {'section': 'parameter', 'type': cfg_type, 'chipID': chipID,
+                           'config_name': config_name, 'param': param, 'value': store.get(chipID, param)}
+
+    @staticmethod
+    def export(module_data, path, fmt=None, cache=None):
+        fmt = fmt or os.path.splitext(ConfigIO.strip_suffix(path))[1].lstrip('.').lower() or 'txt'
+        if fmt not in SummaryBuilder.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported summary format: {fmt}")
+        
+        count = 0
+        with ConfigIO.open_text(path, 'w') as f:
+            if fmt == 'txt':
+                for line in SummaryBuilder.iter_summary(module_data, cache):
+                    f.write(line + "\n")
+                    count += 1
+            elif fmt == 'csv':
+                writer = csv.DictWriter(f, fieldnames=SummaryBuilder.CSV_FIELDS, lineterminator="\n")
+                writer.writeheader()
+                for record in SummaryBuilder.iter_records(module_data):
+                    writer.writerow(record)
+                    count += 1
+            else:
+                f.write('{"serial_number": ' + json.dumps(module_data.serial_number) + ', "records": [')
+                for record in SummaryBuilder.iter_records(module_data):
+                    f.write(("\n" if count == 0 else ",\n") + json.dumps(record))
+                    count += 1
+                f.write("\n]}\n")
+        return count
+
+
+class ModulePool:
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.modules = OrderedDict()
+        self.content_pool = ContentPool()
+        self.schema = RegisterSchema()
+
+    def _refresh(self, module_data):
+        changes = LiveReloader.find_changes(module_data)
+        if changes:
+            LiveReloader.merge(module_data, changes)
+
+    def _evict(self):
+        for path in list(self.modules)[:-1]:
+            if len(self.modules) <= self.capacity:
+                break
+            if not self.modules[path].has_unsaved_changes():
+                self.modules.pop(path).clear()
+
+    def get(self, path):
+        path = os.path.abspath(path)
+        module_data = self.modules.get(path)
+        
+        if module_data is not None:
+            self.modules.move_to_end(path)
+            self._refresh(module_data)
+            return module_data
+        
+        module_data = _load_module(path, ModuleData(self.content_pool))
+        if module_data is None:
+            raise ValueError(f"No module configurations found in {path}")
+        
+        self.modules[path] = module_data
+        self._evict()
+        return module_data
+
+    def evict(self, path):
+        module_data = self.modules.pop(os.path.abspath(path), None)
+        if module_data is not None:
+            module_data.clear()
+        return module_data is not None
+
+
+class ConfigService:
+
+    DEFAULT_ADDRESS = "127.0.0.1:8765"
+    
+    REQUIRED_FIELDS = {
+        'get': ['path'], 'ports': ['path'], 'set': ['path', 'type', 'chipID', 'param', 'value'],
+        'validate': ['path'], 'connectivity': ['path'], 'summary': ['path'], 'save': ['path'], 'evict': ['path']
+    }
+
+    def __init__(self, capacity=8):
+        self.pool = ModulePool(capacity)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def parse_address(address):
+        if address.startswith("unix:"):
+            return 'unix', address[len("unix:"):]
+        host, _, port = address.rpartition(":")
+        return 'tcp', (host or "127.0.0.1", int(port))
+
+    def _op_ping(self, request):
+        return {}
+
+    def _op_modules(self, request):
+        return {'modules': [{'path': path, 'serial': md.serial_number, 'modifications': len(md.modified_data)}
+                            for path, md in self.pool.modules.items()]}
+
+    def _op_get(self, request):
+        module_data = self.pool.get(request['path'])
+        result = {}
+        for cfg_type in [request['type']] if request.get('type') else module_data.loaded_families():
+            store = module_data.get_params_by_type(cfg_type)
+            chips = [str(request['chipID'])] if request.get('chipID') is not None else store.chip_ids
+            result[cfg_type] = {
+                chipID: {param: store.get(chipID, param) for param in store.chip_params(chipID)
+                         if not request.get('param') or param == request['param']}
+                for chipID in chips if chipID in store
+            }
+        return {'serial': module_data.serial_number, 'values': result}
+
+    def _op_ports(self, request):
+        module_data = self.pool.get(request['path'])
+        return {'ports': {cfg_type: module_data.get_ports_by_type(cfg_type)
+                          for cfg_type in module_data.loaded_families()}}
+
+    def _op_set(self, request):
+        module_data = self.pool.get(request['path'])
+        cfg_type, chipID, param = request['type'], str(request['chipID']), request['param']
+        if cfg_type not in module_data.families:
+            raise ValueError(f"Unknown configuration family: {cfg_type}")
+        store = module_data.get_params_by_type(cfg_type)
+        if chipID not in store:
+            raise ValueError(f"ChipID {chipID} has no {cfg_type} configuration")
+        if param not in store.chip_params(chipID):
+            raise ValueError(f"ChipID {chipID} has no editable {cfg_type} parameter {param}")
+        
+        value = request['value']
+        if isinstance(value, str):
+            value = ParameterValidator.convert_value(param, value)
+        else:
+            reason = self.pool.schema.check(param, value)
+            if reason:
+                raise ValueError(f"{param} {reason}")
         
-        SummaryBuilder._add_statistics(lines, module_data)
-        SummaryBuilder._add_connectivity(lines, module_data)
-        SummaryBuilder._add_modifications(lines, module_data)
-        SummaryBuilder._add_all_parameters(lines, module_data)
-        SummaryBuilder._add_footer(lines, module_data)
+        store.set(chipID, param, value)
+        module_data.record_modification(chipID, param, value, cfg_type, module_data.get_config_name(chipID))
+        return {'value': value}
+
+    def _op_validate(self, request):
+        violations = self.pool.schema.validate_module(self.pool.get(request['path']))
+        return {'violations': [v._asdict() for v in violations]}
+
+    def _op_connectivity(self, request):
+        issues = self.pool.get(request['path']).connectivity.check()
+        return {'issues': [issue._asdict() for issue in issues]}
+
+    def _op_summary(self, request):
+        return {'summary': SummaryBuilder.build_summary(self.pool.get(request['path']))}
+
+    def _op_save(self, request):
+        module_data = self.pool.get(request['path'])
+        saved_path = FileSaver.save_changes(module_data, compression=request.get('compression'))
+        return {'saved_path': saved_path}
+
+    def _op_evict(self, request):
+        return {'evicted': self.pool.evict(request['path'])}
+
+    def handle(self, request):
+        handler = getattr(self, f"_op_{request.get('op')}", None)
+        if handler is None:
+            return {'ok': False, 'error': f"Unknown operation: {request.get('op')}"}
+        missing = [field for field in ConfigService.REQUIRED_FIELDS.get(request['op'], []) if field not in request]
+        if missing:
+            return {'ok': False, 'error': f"Missing field: {', '.join(missing)}"}
+        try:
+            response = handler(request)
+        except (OSError, ValueError, SyntaxError) as e:
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            print(f"Internal error handling {request['op']}: {type(e).__name__}: {str(e)}")
+            return {'ok': False, 'error': f"Internal error: {type(e).__name__}: {str(e)}"}
+        response['ok'] = True
+        return response
+
+    async def _handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"Invalid request: {str(e)}"}
+                else:
+                    response = await loop.run_in_executor(self.executor, self.handle, request)
+                writer.write(json.dumps(response).encode('utf-8') + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, address=DEFAULT_ADDRESS, ready=None):
+        kind, target = ConfigService.parse_address(address)
+        if kind == 'unix':
+            server = await asyncio.start_unix_server(self._handle_connection, path=target)
+        else:
+            server = await asyncio.start_server(self._handle_connection, *target)
         
-        return "\n".join(lines)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+
+class ConfigServiceClient(ABC):
+
+    @abstractmethod
+    def _send(self, request):
+        pass
+
+    def request(self, op, **fields):
+        response = self._send(dict(fields, op=op))
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', "Unknown service error"))
+        return response
+
+    def get(self, path, **fields):
+        return self.request('get', path=path, **fields)['values']
+
+    def set(self, path, cfg_type, chipID, param, value):
+        return self.request('set', path=path, type=cfg_type, chipID=chipID, param=param, value=value)['value']
+
+    def summary(self, path):
+        return self.request('summary', path=path)['summary']
+
+    def save(self, path, compression=None):
+        return self.request('save', path=path, compression=compression)['saved_path']
+
+
+class ConfigClient(ConfigServiceClient):
+
+    def __init__(self, address=ConfigService.DEFAULT_ADDRESS, timeout=60):
+        kind, target = ConfigService.parse_address(address)
+        if kind == 'unix':
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(target)
+        self.stream = self.sock.makefile('rwb')
+
+    def _send(self, request):
+        self.stream.write(json.dumps(request).encode('utf-8') + b"\n")
+        self.stream.flush()
+        line = self.stream.readline()
+        if not line:
+            raise RuntimeError("Connection closed by configuration service")
+        return json.loads(line)
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+class LocalConfigClient(ConfigServiceClient):
+
+    def __init__(self, service=None):
+        self.service = service or ConfigService()
+
+    def _send(self, request):
+        response = self.service.handle(json.loads(json.dumps(request)))
+        return json.loads(json.dumps(response))
+
+    def close(self):
+        pass
 
 
 class EditParameterDialog(QDialog):
@@ -387,11 +3620,12 @@ class EditParameterDialog(QDialog):
         
         layout = QVBoxLayout()
         
-        is_cold = self.param_info['is_cold']
-        header = QLabel("❄️ COLD Configuration" if is_cold else "🔥 WARM Configuration")
+        cfg_type = self.param_info['type']
+        color = StyleConfig.family_colors(cfg_type)['header']
+        header = QLabel(f"{StyleConfig.family_icon(cfg_type)} {cfg_type.upper()} Configuration")
         header.setStyleSheet(
             f"font-size: 22px; font-weight: bold; color: white; "
-            f"background-color: {StyleConfig.COLORS['cold']['header'] if is_cold else StyleConfig.COLORS['warm']['header']}; "
+            f"background-color: {color}; "
             f"padding: 15px; border-radius: 5px;"
         )
         header.setAlignment(Qt.AlignCenter)
@@ -400,7 +3634,7 @@ class EditParameterDialog(QDialog):
         self._add_details(layout)
         
         layout.addWidget(QLabel(f"<b style='font-size: 18px;'>Current Value:</b> "
-                               f"<span style='color: {StyleConfig.COLORS['cold']['header'] if is_cold else StyleConfig.COLORS['warm']['header']};'>"
+                               f"<span style='color: {color};'>"
                                f"{self.param_info['current_value']}</span>"))
         
         self.value_input = QLineEdit(self.param_info['current_value'])
@@ -442,23 +3676,353 @@ class EditParameterDialog(QDialog):
     def get_new_value(self):
         val_str = self.value_input.text().strip()
         if not val_str:
-            raise ValueError("Please enter a value")
-        
-        return ParameterValidator.convert_value(self.param_info['param'], val_str)
+            raise ValueError("Please enter a value")
+        
+        return ParameterValidator.convert_value(self.param_info['param'], val_str)
+
+
+class PixelMaskDialog(QDialog):
+    
+    def __init__(self, parent, module_data):
+        super().__init__(parent)
+        self.module_data = module_data
+        self.setup_ui()
+    
+    def setup_ui(self):
+        self.setWindowTitle("Pixel Mask Operations")
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(500)
+        
+        layout = QVBoxLayout()
+        
+        header = QLabel("🎭 Pixel Mask Operations")
+        header.setStyleSheet(
+            "font-size: 22px; font-weight: bold; color: white; "
+            "background-color: #2E86AB; padding: 15px; border-radius: 5px;"
+        )
+        header.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header)
+        
+        mask_layout = QHBoxLayout()
+        self.mask_input = QLineEdit()
+        self.mask_input.setPlaceholderText("Mask file (coordinate list or bitmap)")
+        self.mask_input.setStyleSheet(
+            "font-size: 16px; padding: 8px; border: 2px solid #2E86AB; border-radius: 5px;"
+        )
+        button_browse = QPushButton("Browse")
+        button_browse.setStyleSheet(StyleConfig.get_button_style(16, "#6C757D") + " padding: 8px;")
+        button_browse.clicked.connect(self.browse_mask)
+        mask_layout.addWidget(self.mask_input, stretch=4)
+        mask_layout.addWidget(button_browse, stretch=1)
+        layout.addLayout(mask_layout)
+        
+        layout.addWidget(QLabel("<b>Chips:</b>"))
+        self.chip_list = QListWidget()
+        self.chip_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.chip_list.setStyleSheet("font-size: 16px;")
+        for chipID in sorted(self.module_data.get_all_chip_ids()):
+            self.chip_list.addItem(chipID)
+        self.chip_list.selectAll()
+        layout.addWidget(self.chip_list)
+        
+        type_layout = QHBoxLayout()
+        self.type_checks = {}
+        for cfg_type in self.module_data.loaded_families():
+            check = QCheckBox(f"{StyleConfig.family_icon(cfg_type)} {StyleConfig.family_label(cfg_type)}")
+            check.setChecked(cfg_type in ModuleData.REQUIRED_FAMILIES)
+            check.setStyleSheet("font-size: 16px;")
+            type_layout.addWidget(check)
+            self.type_checks[cfg_type] = check
+        type_layout.addStretch()
+        layout.addLayout(type_layout)
+        
+        action_layout = QHBoxLayout()
+        for text, color, slot in [
+            ("Apply Mask", "#DC3545", self.apply_mask),
+            ("Copy Cold TDAC → Warm", "#007BFF", self.copy_tdac),
+            ("Count Masked Pixels", "#17A2B8", self.count_masked)
+        ]:
+            button = QPushButton(text)
+            button.setMinimumHeight(45)
+            button.setStyleSheet(StyleConfig.get_button_style(16, color))
+            button.clicked.connect(slot)
+            action_layout.addWidget(button)
+        layout.addLayout(action_layout)
+        
+        self.result_text = QTextEdit()
+        self.result_text.setReadOnly(True)
+        self.result_text.setStyleSheet(
+            "font-size: 15px; background-color: #F8F9FA; border: 2px solid #2E86AB; "
+            "border-radius: 5px; padding: 8px;"
+        )
+        layout.addWidget(self.result_text)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.setStyleSheet("font-size: 16px;")
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+    
+    def browse_mask(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Select Mask File", "",
+                                              "Mask files (*.json *.txt *.dat);;All files (*)")
+        if path:
+            self.mask_input.setText(path)
+    
+    def selected_chips(self):
+        return [item.text() for item in self.chip_list.selectedItems()]
+    
+    def selected_types(self):
+        return [cfg_type for cfg_type, check in self.type_checks.items() if check.isChecked()]
+    
+    def apply_mask(self):
+        path = self.mask_input.text().strip()
+        if not path:
+            QMessageBox.warning(self, "Warning", "Please select a mask file")
+            return
+        
+        try:
+            mask = PixelMaskEditor.load_mask(path)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to load mask:\n{str(e)}")
+            return
+        
+        start = time.perf_counter()
+        lines = [f"Mask: {os.path.basename(path)} ({sum(len(r) for r in mask.values())} pixels)"]
+        
+        for cfg_type in self.selected_types():
+            modules = self.module_data.get_module_by_type(cfg_type)
+            for chipID in self.selected_chips():
+                module = modules.get(chipID)
+                if module is None:
+                    continue
+                affected = PixelMaskEditor.apply_mask(module, mask)
+                total = PixelMaskEditor.count_pixels(module)
+                if affected:
+                    self.module_data.record_pixel_edit(chipID, cfg_type, module['config_name'], {
+                        'op': 'mask', 'fields': PixelMaskEditor.MASK_FIELDS,
+                        'pixels': affected, 'source': os.path.basename(path)
+                    })
+                lines.append(f"  • {cfg_type.upper()} ChipID {chipID}: {affected} newly masked, "
+                             f"{total} disabled in total")
+        
+        lines.append(f"Done in {(time.perf_counter() - start) * 1000:.1f} ms")
+        self.result_text.setText("\n".join(lines))
+    
+    def copy_tdac(self):
+        start = time.perf_counter()
+        lines = ["Copy TDAC cold → warm:"]
+        
+        for chipID in self.selected_chips():
+            cold_module = self.module_data.cold_modules.get(chipID)
+            warm_module = self.module_data.warm_modules.get(chipID)
+            if cold_module is None or warm_module is None:
+                lines.append(f"  • ChipID {chipID}: skipped (missing cold or warm configuration)")
+                continue
+            changed = PixelMaskEditor.copy_tdac(cold_module, warm_module)
+            if changed:
+                self.module_data.record_pixel_edit(chipID, "warm", warm_module['config_name'], {
+                    'op': 'copy', 'fields': ["TDAC"], 'pixels': changed, 'source': "cold"
+                })
+            lines.append(f"  • ChipID {chipID}: {changed} pixels changed")
+        
+        lines.append(f"Done in {(time.perf_counter() - start) * 1000:.1f} ms")
+        self.result_text.setText("\n".join(lines))
+    
+    def count_masked(self):
+        lines = ["Disabled pixels (Enable = 0):"]
+        
+        for cfg_type in self.selected_types():
+            modules = self.module_data.get_module_by_type(cfg_type)
+            for chipID in self.selected_chips():
+                if chipID in modules:
+                    count = PixelMaskEditor.count_pixels(modules[chipID])
+                    lines.append(f"  • {cfg_type.upper()} ChipID {chipID}: {count}")
+        
+        self.result_text.setText("\n".join(lines))
+
+
+class CrossModuleDialog(QDialog):
+
+    def __init__(self, parent, workspace):
+        super().__init__(parent)
+        self.workspace = workspace
+        self.model = CrossModuleModel(workspace, self)
+        self.setup_ui()
+        self.select_parameter(self.combo_param.currentText())
+
+    def setup_ui(self):
+        self.setWindowTitle("Compare Modules")
+        self.setMinimumWidth(1000)
+        self.setMinimumHeight(650)
+
+        layout = QVBoxLayout()
+
+        header = QLabel(f"🧮 Compare Across {len(self.workspace)} Modules")
+        header.setStyleSheet(
+            "font-size: 22px; font-weight: bold; color: white; "
+            "background-color: #2E86AB; padding: 15px; border-radius: 5px;"
+        )
+        header.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header)
+
+        controls = QHBoxLayout()
+        param_label = QLabel("Parameter:")
+        param_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.combo_param = QComboBox()
+        self.combo_param.addItems(self.workspace.parameter_names())
+        self.combo_param.setStyleSheet("font-size: 18px; padding: 5px;")
+        self.combo_param.currentTextChanged.connect(self.select_parameter)
+        controls.addWidget(param_label)
+        controls.addWidget(self.combo_param)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setAlternatingRowColors(True)
+        self.table.setStyleSheet("""
+            QTableView {
+                font-size: 15px;
+                gridline-color: #CED4DA;
+                border: 2px solid #2E86AB;
+                selection-background-color: #FFC107;
+                selection-color: black;
+            }
+            QHeaderView::section {
+                background-color: #2E86AB;
+                color: white;
+                font-weight: bold;
+                font-size: 16px;
+                padding: 10px;
+                border: 1px solid #1A5F7A;
+            }
+        """)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.stats_text = QTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setMaximumHeight(130)
+        self.stats_text.setStyleSheet(
+            "font-size: 15px; background-color: #F8F9FA; border: 2px solid #2E86AB; "
+            "border-radius: 5px; padding: 8px;"
+        )
+        layout.addWidget(self.stats_text)
+
+        edit_layout = QHBoxLayout()
+        self.value_input = QLineEdit()
+        self.value_input.setPlaceholderText("New value for the selected cells")
+        self.value_input.setStyleSheet(
+            "font-size: 16px; padding: 8px; border: 2px solid #2E86AB; border-radius: 5px;"
+        )
+        button_set = QPushButton("✏️ Set Selected")
+        button_set.setMinimumHeight(45)
+        button_set.setStyleSheet(StyleConfig.get_button_style(16, "#007BFF"))
+        button_set.clicked.connect(self.set_selected)
+        edit_layout.addWidget(self.value_input, stretch=4)
+        edit_layout.addWidget(button_set, stretch=1)
+        layout.addLayout(edit_layout)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.setStyleSheet("font-size: 16px;")
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.setLayout(layout)
+
+    def select_parameter(self, param):
+        self.model.set_parameter(param)
+        self.update_statistics()
+
+    def update_statistics(self):
+        modules = {id(module_data) for module_data, chipID in self.model.rows}
+        lines = [f"{self.model.param}: {self.model.rowCount()} chips in {len(modules)} module(s)"]
+
+        for family in self.model.families:
+            values = [value for value in self.model.values(family)
+                      if isinstance(value, (int, float)) and not isinstance(value, bool)]
+            if not values:
+                continue
+            lines.append(f"  • {StyleConfig.family_icon(family)} {StyleConfig.family_label(family)}: "
+                         f"n={len(values)}  min={min(values):.6g}  max={max(values):.6g}  "
+                         f"mean={statistics.fmean(values):.6g}  spread={max(values) - min(values):.6g}")
+
+        self.stats_text.setText("\n".join(lines))
+
+    def set_selected(self):
+        indexes = self.table.selectionModel().selectedIndexes()
+        if not indexes:
+            QMessageBox.warning(self, "Warning", "Please select the value cells to change")
+            return
+
+        val_str = self.value_input.text().strip()
+        if not val_str:
+            QMessageBox.warning(self, "Warning", "Please enter a value")
+            return
+
+        try:
+            value = ParameterValidator.convert_value(self.model.param, val_str)
+        except (ValueError, SyntaxError) as e:
+            QMessageBox.warning(
+                self, "Error",
+                f"Invalid value format!\n\n{str(e)}\n\n"
+                f"Expected: {ParameterValidator.get_type_hint(self.model.param)}"
+            )
+            return
+
+        changed = self.model.set_value(indexes, value)
+        if not changed:
+            QMessageBox.warning(self, "Warning", "Please click on configuration value cells to edit")
+            return
+
+        self.update_statistics()
+        QMessageBox.information(self, "Success", f"{self.model.param} set to {value} in {changed} configuration(s)")
 
 
 class MainWindow(QMainWindow):
+    
+    SESSION_INTERVAL_MS = 60000
+    SERIAL_DEBOUNCE_MS = 300
+    SUMMARY_PAGE_LINES = 400
+    
+    folders_found = pyqtSignal(str, object)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ATLAS Module Configuration GUI")
         self.setGeometry(700, 300, 1200, 700)
         
         self.base_directory = "//wsl$/Ubuntu/home/zanko/pf_labs/Interfaccia"
-        self.module_data = ModuleData()
+        self.content_pool = ContentPool()
+        self.register_schema = RegisterSchema()
+        self.module_data = ModuleData(self.content_pool)
+        self.workspace = Workspace(self.content_pool)
         self.style_config = StyleConfig()
+        self.speculative_loader = SpeculativeLoader(self.content_pool, self)
+        self.speculative_loader.prefetched.connect(self.finish_prefetched_load)
+        self.workspace_loader = WorkspaceLoader(self.content_pool, self)
+        self.workspace_loader.module_loaded.connect(self.add_background_module)
+        self.module_watcher = ModuleWatcher(self)
+        self.module_watcher.changes_ready.connect(self.apply_external_changes)
+        self.summary_cache = SummaryCache()
+        self.summary_lines = []
+        self.summary_page = 0
+        self.session_timer = QTimer(self)
+        self.session_timer.setInterval(self.SESSION_INTERVAL_MS)
+        self.session_timer.timeout.connect(self.save_session)
+        self.serial_timer = QTimer(self)
+        self.serial_timer.setSingleShot(True)
+        self.serial_timer.setInterval(self.SERIAL_DEBOUNCE_MS)
+        self.serial_timer.timeout.connect(self.search_serial_folders)
+        self.folder_search = ThreadPoolExecutor(max_workers=1)
+        self.folders_found.connect(self.apply_serial_matches)
         
         self.setup_ui()
         self.connect_signals()
+        self.session_timer.start()
+        QTimer.singleShot(0, self.offer_session_restore)
     
     def setup_ui(self):
         self.stacked_widget = QStackedWidget()
@@ -467,14 +4031,17 @@ class MainWindow(QMainWindow):
         self.page1 = QWidget()
         self.page2 = QWidget()
         self.page3 = QWidget()
+        self.page_stats = QWidget()
         
         self.stacked_widget.addWidget(self.page1)
         self.stacked_widget.addWidget(self.page2)
         self.stacked_widget.addWidget(self.page3)
+        self.stacked_widget.addWidget(self.page_stats)
         
         self.setup_page1()
         self.setup_page2()
         self.setup_page3()
+        self.setup_stats_page()
     
     def connect_signals(self):
 
@@ -482,18 +4049,32 @@ class MainWindow(QMainWindow):
         self.edit_line_path.textChanged.connect(self.check_serial_text)
         self.button_browse.clicked.connect(self.browse_folder)
         self.button_load.clicked.connect(self.load_module_data)
+        self.button_load_all.clicked.connect(self.load_matching_modules)
+        self.button_stats.clicked.connect(self.open_fleet_statistics)
         self.button_next_1.clicked.connect(lambda: self.switch_page(self.page2))
         
         # Page 2
         self.button_edit.clicked.connect(self.edit_parameter)
+        self.button_masks.clicked.connect(self.open_pixel_masks)
         self.button_save.clicked.connect(self.save_all_changes)
         self.button_back_2.clicked.connect(lambda: self.switch_page(self.page1))
         self.button_next_2.clicked.connect(self.go_to_summary)
         self.button_refresh.clicked.connect(self.populate_parameter_table)
+        self.button_compare.clicked.connect(self.open_cross_module_view)
+        self.module_tabs.currentChanged.connect(self.activate_module_tab)
+        self.module_tabs.tabCloseRequested.connect(self.close_module_tab)
         
         # Page 3
         self.button_back_3.clicked.connect(lambda: self.switch_page(self.page2))
         self.button_finish.clicked.connect(self.finish_and_reset)
+        self.button_summary_prev.clicked.connect(lambda: self.show_summary_page(self.summary_page - 1))
+        self.button_summary_next.clicked.connect(lambda: self.show_summary_page(self.summary_page + 1))
+        self.button_export_summary.clicked.connect(self.export_summary)
+        
+        # Statistics page
+        self.combo_stats_param.currentTextChanged.connect(self.show_fleet_statistics)
+        self.button_stats_rebuild.clicked.connect(lambda: self.open_fleet_statistics(rebuild=True))
+        self.button_back_stats.clicked.connect(lambda: self.switch_page(self.page1))
 
     def setup_page1(self):
         layout = QVBoxLayout()
@@ -566,6 +4147,16 @@ class MainWindow(QMainWindow):
         self.button_load.setStyleSheet(StyleConfig.get_button_style(24, "#2E86AB"))
         input_layout.addWidget(self.button_load)
         
+        self.button_load_all = QPushButton("🗂️ Open All Matches in Workspace")
+        self.button_load_all.setMinimumHeight(50)
+        self.button_load_all.setStyleSheet(StyleConfig.get_button_style(20, "#6F42C1"))
+        input_layout.addWidget(self.button_load_all)
+        
+        self.button_stats = QPushButton("📈 Fleet Statistics")
+        self.button_stats.setMinimumHeight(50)
+        self.button_stats.setStyleSheet(StyleConfig.get_button_style(20, "#17A2B8"))
+        input_layout.addWidget(self.button_stats)
+        
         input_group.setLayout(input_layout)
         return input_group
 
@@ -584,6 +4175,11 @@ class MainWindow(QMainWindow):
         
         filter_layout = self.create_filter_layout()
         
+        self.module_tabs = QTabBar()
+        self.module_tabs.setTabsClosable(True)
+        self.module_tabs.setExpanding(False)
+        self.module_tabs.setStyleSheet("QTabBar::tab { font-size: 16px; padding: 8px 16px; }")
+        
         self.param_table = self.create_parameter_table()
         
         button_layout = QHBoxLayout()
@@ -595,8 +4191,22 @@ class MainWindow(QMainWindow):
         self.button_save.setMinimumHeight(60)
         self.button_save.setStyleSheet(StyleConfig.get_button_style(20, "#FFC107"))
         
+        self.button_masks = QPushButton("🎭 Pixel Masks")
+        self.button_masks.setMinimumHeight(60)
+        self.button_masks.setStyleSheet(StyleConfig.get_button_style(20, "#6F42C1"))
+        
+        self.button_compare = QPushButton("🧮 Compare Modules")
+        self.button_compare.setMinimumHeight(60)
+        self.button_compare.setStyleSheet(StyleConfig.get_button_style(20, "#17A2B8"))
+        
+        self.check_compress = QCheckBox("🗜️ Compress output (.gz)")
+        self.check_compress.setStyleSheet("font-size: 16px;")
+        
         button_layout.addWidget(self.button_edit)
+        button_layout.addWidget(self.button_masks)
+        button_layout.addWidget(self.button_compare)
         button_layout.addWidget(self.button_save)
+        button_layout.addWidget(self.check_compress)
         
         nav_layout = QHBoxLayout()
         self.button_back_2 = QPushButton("← Back")
@@ -613,6 +4223,7 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(header)
         layout.addLayout(filter_layout)
+        layout.addWidget(self.module_tabs)
         layout.addWidget(self.param_table)
         layout.addLayout(button_layout)
         layout.addLayout(nav_layout)
@@ -627,22 +4238,17 @@ class MainWindow(QMainWindow):
         legend_label.setStyleSheet("font-size: 18px; font-weight: bold;")
         filter_layout.addWidget(legend_label)
         
-        cold_legend = QLabel("■ COLD (Left Column)")
-        cold_legend.setStyleSheet(
-            "font-size: 16px; color: white; background-color: #1E88E5; "
-            "padding: 5px 10px; border-radius: 3px; font-weight: bold;"
-        )
-        filter_layout.addWidget(cold_legend)
-        
-        warm_legend = QLabel("■ WARM (Right Column)")
-        warm_legend.setStyleSheet(
-            "font-size: 16px; color: white; background-color: #FF6B35; "
-            "padding: 5px 10px; border-radius: 3px; font-weight: bold;"
-        )
-        filter_layout.addWidget(warm_legend)
+        for family in ModuleData.FAMILIES:
+            colors = StyleConfig.family_colors(family)
+            legend = QLabel(colors['legend'].format(family.upper()))
+            legend.setStyleSheet(
+                f"font-size: 16px; color: white; background-color: {colors['header']}; "
+                "padding: 5px 10px; border-radius: 3px; font-weight: bold;"
+            )
+            filter_layout.addWidget(legend)
         filter_layout.addSpacing(30)
         
-        info_label = QLabel("ℹ️ Click on Cold or Warm value to edit")
+        info_label = QLabel("ℹ️ Click on a configuration value to edit")
         info_label.setStyleSheet("font-size: 16px; color: #495057; font-style: italic;")
         filter_layout.addWidget(info_label)
         
@@ -656,17 +4262,8 @@ class MainWindow(QMainWindow):
     
     def create_parameter_table(self):
         table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels(["ChipID", "Config Name", "Parameter", 
-                                         "❄️ Cold Value", "🔥 Warm Value", "Status"])
-        
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.Stretch)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        self.table_families = []
+        self.configure_table_columns(table, ModuleData.REQUIRED_FAMILIES)
         
         table.setAlternatingRowColors(True)
         table.setStyleSheet("""
@@ -705,44 +4302,157 @@ class MainWindow(QMainWindow):
             "border-radius: 10px; padding: 15px;"
         )
         
+        page_layout = QHBoxLayout()
+        self.button_summary_prev = QPushButton("◀ Previous")
+        self.button_summary_prev.setMinimumHeight(40)
+        self.button_summary_prev.setStyleSheet(StyleConfig.get_button_style(16, "#6C757D"))
+        
+        self.summary_page_label = QLabel("")
+        self.summary_page_label.setStyleSheet("font-size: 16px; color: #495057;")
+        
+        self.button_summary_next = QPushButton("Next ▶")
+        self.button_summary_next.setMinimumHeight(40)
+        self.button_summary_next.setStyleSheet(StyleConfig.get_button_style(16, "#6C757D"))
+        
+        page_layout.addStretch()
+        page_layout.addWidget(self.button_summary_prev)
+        page_layout.addWidget(self.summary_page_label)
+        page_layout.addWidget(self.button_summary_next)
+        page_layout.addStretch()
+        
         nav_layout = QHBoxLayout()
         self.button_back_3 = QPushButton("← Back to Edit")
         self.button_back_3.setMinimumHeight(70)
         self.button_back_3.setStyleSheet(StyleConfig.get_button_style(22, "#6C757D"))
         
+        self.button_export_summary = QPushButton("📤 Export Summary")
+        self.button_export_summary.setMinimumHeight(70)
+        self.button_export_summary.setStyleSheet(StyleConfig.get_button_style(22, "#17A2B8"))
+        
         self.button_finish = QPushButton("✓ Finish")
         self.button_finish.setMinimumHeight(70)
         self.button_finish.setStyleSheet(StyleConfig.get_button_style(22, "#28A745"))
         
         nav_layout.addWidget(self.button_back_3)
         nav_layout.addStretch()
+        nav_layout.addWidget(self.button_export_summary)
         nav_layout.addWidget(self.button_finish)
         
         layout.addWidget(title)
         layout.addWidget(self.summary_text)
+        layout.addLayout(page_layout)
         layout.addLayout(nav_layout)
         
         self.page3.setLayout(layout)
         self.page3.setStyleSheet("background-color: white; padding: 20px;")
+    
+    def setup_stats_page(self):
+        layout = QVBoxLayout()
+        
+        title = QLabel("📈 Fleet Statistics")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 36px; font-weight: bold; color: #17A2B8; margin: 20px;")
+        
+        controls = QHBoxLayout()
+        param_label = QLabel("Parameter:")
+        param_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.combo_stats_param = QComboBox()
+        self.combo_stats_param.addItems(FleetStatistics.PARAMS)
+        self.combo_stats_param.setStyleSheet("font-size: 18px; padding: 5px;")
+        self.stats_info_label = QLabel("")
+        self.stats_info_label.setStyleSheet("font-size: 16px; color: #495057;")
+        
+        controls.addWidget(param_label)
+        controls.addWidget(self.combo_stats_param)
+        controls.addSpacing(20)
+        controls.addWidget(self.stats_info_label)
+        controls.addStretch()
+        
+        self.stats_text = QTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setStyleSheet(
+            "font-family: monospace; font-size: 15px; background-color: #F8F9FA; "
+            "border: 2px solid #17A2B8; border-radius: 10px; padding: 15px;"
+        )
+        
+        nav_layout = QHBoxLayout()
+        self.button_back_stats = QPushButton("← Back")
+        self.button_back_stats.setMinimumHeight(60)
+        self.button_back_stats.setStyleSheet(StyleConfig.get_button_style(20, "#6C757D"))
+        
+        self.button_stats_rebuild = QPushButton("🔄 Rebuild Cache")
+        self.button_stats_rebuild.setMinimumHeight(60)
+        self.button_stats_rebuild.setStyleSheet(StyleConfig.get_button_style(20, "#17A2B8"))
+        
+        nav_layout.addWidget(self.button_back_stats)
+        nav_layout.addStretch()
+        nav_layout.addWidget(self.button_stats_rebuild)
+        
+        layout.addWidget(title)
+        layout.addLayout(controls)
+        layout.addWidget(self.stats_text)
+        layout.addLayout(nav_layout)
+        
+        self.page_stats.setLayout(layout)
+        self.page_stats.setStyleSheet("background-color: white; padding: 20px;")
 
     def check_serial_text(self, text):
-        is_valid = os.path.isdir(text) or self.find_folder_by_serial(text)
+        self.serial_timer.start()
+    
+    def search_serial_folders(self):
+        text = self.edit_line_path.text()
+        future = self.folder_search.submit(MainWindow.scan_matching_folders, self.base_directory, text)
+        future.add_done_callback(lambda f: self.folders_found.emit(text, f))
+    
+    def apply_serial_matches(self, text, future):
+        if text != self.edit_line_path.text():
+            return
+        if future.exception() is not None:
+            print(f"Cannot search {self.base_directory}: {str(future.exception())}")
+            return
+        matches = future.result()
+        
+        is_valid = bool(matches)
         style = StyleConfig.get_input_style(
             3 if is_valid else 2,
             "#28A745" if is_valid else "#2E86AB",
             highlight=is_valid
         )
         self.edit_line_path.setStyleSheet(style)
+        
+        if len(matches) == 1:
+            self.speculative_loader.start(matches[0])
+        else:
+            self.speculative_loader.cancel()
     
-    def find_folder_by_serial(self, serial):
-        if not os.path.isdir(self.base_directory):
-            return None
+    def find_matching_folders(self, text):
+        return MainWindow.scan_matching_folders(self.base_directory, text)
+    
+    @staticmethod
+    def scan_matching_folders(base_directory, text):
+        text = text.strip()
+        if os.path.isdir(text):
+            return [text]
+        return MainWindow.scan_folders(base_directory, text) if text else []
+    
+    def find_folders_by_serial(self, serial):
+        return MainWindow.scan_folders(self.base_directory, serial)
+    
+    @staticmethod
+    def scan_folders(base_directory, serial):
+        if not os.path.isdir(base_directory):
+            return []
         
-        for item in os.listdir(self.base_directory):
-            item_path = os.path.join(self.base_directory, item)
+        matches = []
+        for item in os.listdir(base_directory):
+            item_path = os.path.join(base_directory, item)
             if os.path.isdir(item_path) and serial in item:
-                return item_path
-        return None
+                matches.append(item_path)
+        return matches
+    
+    def find_folder_by_serial(self, serial):
+        matches = self.find_folders_by_serial(serial)
+        return matches[0] if matches else None
     
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Module Folder", self.base_directory)
@@ -750,8 +4460,6 @@ class MainWindow(QMainWindow):
             self.edit_line_path.setText(folder)
     
     def load_module_data(self): 
-        self.module_data.clear()
-        
         input_text = self.edit_line_path.text().strip() 
         base_path = input_text if os.path.isdir(input_text) else self.find_folder_by_serial(input_text)
         
@@ -763,40 +4471,255 @@ class MainWindow(QMainWindow):
             )
             return
         
-        self.module_data.serial_number = os.path.basename(base_path)
-        self.module_data.base_module_path = base_path 
+        open_module = self.workspace.get(base_path)
+        if open_module is not None and open_module.has_unsaved_changes():
+            self.speculative_loader.cancel()
+            self.activate_module(base_path)
+            self.show_workspace_status()
+            self.status_label.setText(f"🗂️ Module {open_module.serial_number} is already open with edits")
+            return
         
-        cold_ok = ConfigLoader.load_config(base_path, "cold", self.module_data)
-        warm_ok = ConfigLoader.load_config(base_path, "warm", self.module_data)
+        if self.speculative_loader.claim(base_path):
+            self.status_label.setText(f"⏳ Loading {os.path.basename(base_path)}...")
+            return
+        self.complete_module_load(base_path, self.speculative_loader.take(base_path))
+    
+    def finish_prefetched_load(self, path, future):
+        if self.speculative_loader.owns(future):
+            self.complete_module_load(path, self.speculative_loader.take(path))
+    
+    def complete_module_load(self, base_path, prefetched):
+        if prefetched:
+            module_data, cold_ok, warm_ok = prefetched
+        else:
+            module_data = ModuleData(self.content_pool)
+            module_data.serial_number = os.path.basename(base_path)
+            module_data.base_module_path = base_path 
+            
+            loaded = ConfigLoader.load_families(base_path, module_data)
+            cold_ok, warm_ok = loaded['cold'], loaded['warm']
         
         if cold_ok and warm_ok:
+            self.open_module(module_data)
             self.show_load_success()
         else:
+            module_data.clear()
             QMessageBox.warning(self, "Error", "Failed to load module configurations")
     
+    def load_matching_modules(self):
+        input_text = self.edit_line_path.text().strip()
+        matches = self.find_matching_folders(input_text)
+        if not matches:
+            QMessageBox.warning(
+                self, "Error",
+                f"Module folder not found for serial: {input_text}\n\n"
+                f"Base directory: {self.base_directory}"
+            )
+            return
+        
+        self.speculative_loader.cancel()
+        started = [path for path in matches if path not in self.workspace and self.workspace_loader.load(path)]
+        if started:
+            self.status_label.setText(f"⏳ Loading {len(self.workspace_loader.pending)} module(s) in the background...")
+        else:
+            self.status_label.setText(f"🗂️ All {len(matches)} matching module(s) are already open")
+    
+    def add_background_module(self, path, result):
+        if not self.workspace_loader.take(path):
+            if result is not None:
+                result[0].clear()
+            return
+        
+        if result is None or not (result[1] and result[2]):
+            print(f"Error loading module configurations from {path}")
+            if result is not None:
+                result[0].clear()
+        elif path in self.workspace:
+            result[0].clear()
+        else:
+            module_data = result[0]
+            self.workspace.add(module_data, activate=self.workspace.active is None)
+            if self.workspace.active_module() is module_data:
+                self.module_data = module_data
+                self.module_watcher.watch(module_data)
+            self.refresh_module_tabs()
+        
+        self.show_workspace_status()
+        if self.workspace_loader.pending:
+            self.status_label.setText(f"⏳ Loading {len(self.workspace_loader.pending)} more module(s) in the background...")
+    
+    def show_workspace_status(self):
+        lines = [f"🗂️ Workspace: {len(self.workspace)} module(s) open\n"]
+        for path, module_data in self.workspace.modules.items():
+            marker = "  ◀ active" if path == self.workspace.active else ""
+            lines.append(f"  • {module_data.serial_number}: {len(module_data.get_all_chip_ids())} chips "
+                         f"({', '.join(module_data.loaded_families())}){marker}")
+            if module_data.has_edits():
+                lines.append(f"    - {len(module_data.modified_data)} modification(s), "
+                             f"{len(module_data.pixel_edits)} chip(s) with pixel edits")
+        lines.append("\n💡 Switch modules with the tabs on the parameters page")
+        
+        self.info_text.setText("\n".join(lines))
+        self.status_label.setText(f"✅ Workspace: {len(self.workspace)} module(s) loaded")
+        self.button_next_1.setEnabled(bool(self.workspace))
+    
+    def open_module(self, module_data):
+        self.workspace.add(module_data)
+        self.module_data = module_data
+        self.module_watcher.watch(module_data)
+        self.refresh_module_tabs()
+    
+    def activate_module(self, path):
+        module_data = self.workspace.activate(path)
+        if module_data is None:
+            return
+        if module_data is not self.module_data:
+            self.module_data = module_data
+            self.module_watcher.watch(module_data)
+            self.module_watcher.schedule_check()
+        self.refresh_module_tabs()
+        if self.stacked_widget.currentWidget() is self.page2:
+            self.populate_parameter_table()
+    
+    def refresh_module_tabs(self):
+        self.module_tabs.blockSignals(True)
+        while self.module_tabs.count():
+            self.module_tabs.removeTab(0)
+        for path, module_data in self.workspace.modules.items():
+            label = module_data.serial_number
+            if module_data.has_unsaved_changes():
+                label += f" ✏️{len(module_data.unsaved)}"
+            index = self.module_tabs.addTab(label)
+            self.module_tabs.setTabData(index, path)
+            self.module_tabs.setTabToolTip(index, path)
+            if path == self.workspace.active:
+                self.module_tabs.setCurrentIndex(index)
+        self.module_tabs.blockSignals(False)
+    
+    def activate_module_tab(self, index):
+        if index >= 0:
+            self.activate_module(self.module_tabs.tabData(index))
+    
+    def close_module_tab(self, index):
+        path = self.module_tabs.tabData(index)
+        module_data = self.workspace.get(path) if path else None
+        if module_data is None:
+            return
+        
+        if module_data.has_unsaved_changes():
+            reply = QMessageBox.question(
+                self, "Close Module",
+                f"Module {module_data.serial_number} has {len(module_data.unsaved)} unsaved modification(s).\n\n"
+                "Unsaved changes will be lost. Close it anyway?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+        
+        if module_data is self.module_data:
+            self.module_watcher.stop()
+            self.module_data = ModuleData(self.content_pool)
+        self.workspace.remove(path)
+        
+        if self.workspace.active is not None:
+            self.activate_module(self.workspace.active)
+            return
+        
+        self.refresh_module_tabs()
+        self.param_table.setRowCount(0)
+        self.button_next_1.setEnabled(False)
+        self.status_label.setText("📁 Enter module serial number")
+        self.switch_page(self.page1)
+    
+    def open_cross_module_view(self):
+        if not self.workspace:
+            QMessageBox.warning(self, "Warning", "No module loaded")
+            return
+        
+        dialog = CrossModuleDialog(self, self.workspace)
+        dialog.exec_()
+        self.populate_parameter_table()
+        self.refresh_module_tabs()
+    
+    def save_session(self):
+        modules = self.workspace.dirty_modules()
+        if not modules:
+            SessionSnapshot.discard()
+            return
+        try:
+            SessionSnapshot.write(modules, active=self.module_data.base_module_path)
+        except (OSError, ValueError) as e:
+            print(f"Error writing session snapshot: {str(e)}")
+    
+    def offer_session_restore(self):
+        if not SessionSnapshot.exists():
+            return
+        document = SessionSnapshot.read()
+        if document is None:
+            SessionSnapshot.discard()
+            return
+        
+        saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(document['saved_at']))
+        reply = QMessageBox.question(
+            self, "Restore Session",
+            f"Restore the previous session?\n\n"
+            f"Modules: {', '.join(entry['serial_number'] for entry in document['modules'])}\n"
+            f"Saved: {saved_at}\n"
+            f"Unsaved changes: {sum(len(entry['unsaved']) for entry in document['modules'])}",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            SessionSnapshot.discard()
+            return
+        
+        module_datas = SessionSnapshot.restore(pool=self.content_pool, document=document)
+        if len(module_datas) < len(document['modules']):
+            SessionSnapshot.discard()
+            QMessageBox.warning(
+                self, "Error",
+                f"Failed to restore {len(document['modules']) - len(module_datas)} module(s) of the previous session"
+            )
+        if not module_datas:
+            return
+        
+        for module_data in module_datas:
+            self.open_module(module_data)
+        if document['active'] in self.workspace:
+            self.activate_module(document['active'])
+        
+        self.edit_line_path.blockSignals(True)
+        self.edit_line_path.setText(self.module_data.base_module_path or self.module_data.serial_number)
+        self.edit_line_path.blockSignals(False)
+        if len(module_datas) > 1:
+            self.show_workspace_status()
+        else:
+            self.show_load_success()
+    
     def show_load_success(self):
         all_chips = self.module_data.get_all_chip_ids()
+        families = self.module_data.loaded_families()
         
         info_lines = [
             f"✅ Successfully loaded module: {self.module_data.serial_number}\n",
-            "📊 Statistics:",
-            f"  • Unique cold configurations: {len(self.module_data.cold_modules)}",
-            f"  • Unique warm configurations: {len(self.module_data.warm_modules)}\n",
-            "🔌 Front End Configurations:\n"
+            "📊 Statistics:"
         ]
+        info_lines += [f"  • Unique {cfg_type} configurations: {len(self.module_data.get_params_by_type(cfg_type))}"
+                       for cfg_type in families]
+        info_lines[-1] += "\n"
+        info_lines.append("🔌 Front End Configurations:\n")
         
         for chipID in sorted(all_chips):
-            if chipID in self.module_data.cold_modules:
-                config_name = self.module_data.cold_modules[chipID].get('config_name', 'N/A')
-                info_lines.append(f"  • ChipID {chipID} (Config: {config_name})")
-                info_lines.append("    - Cold configuration loaded ❄️")
-                if chipID in self.module_data.warm_modules:
-                    info_lines.append("    - Warm configuration loaded 🔥")
-            elif chipID in self.module_data.warm_modules:
-                config_name = self.module_data.warm_modules[chipID].get('config_name', 'N/A')
-                info_lines.append(f"  • ChipID {chipID} (Config: {config_name})")
-                info_lines.append("    - Warm configuration loaded 🔥")
-        
+            info_lines.append(f"  • ChipID {chipID} (Config: {self.module_data.get_config_name(chipID)})")
+            for cfg_type in families:
+                if chipID in self.module_data.get_params_by_type(cfg_type):
+                    info_lines.append(f"    - {StyleConfig.family_label(cfg_type)} configuration loaded "
+                                      f"{StyleConfig.family_icon(cfg_type)}")
+        
+        info_lines.append("")
+        info_lines.extend(RegisterSchema.format_report(self.register_schema.validate_module(self.module_data)))
+        info_lines.extend(ConnectivityIndex.format_report(self.module_data.connectivity.check()))
+        info_lines.append(f"\n⏱️ Loaded {self.module_data.load_stats.summary()}")
+        info_lines.append(f"🧬 Shared storage: {self.module_data.storage_summary()}")
         info_lines.append("\n💡 Note: Port connectivity details available in Summary page")
         
         self.info_text.setText("\n".join(info_lines))
@@ -805,50 +4728,58 @@ class MainWindow(QMainWindow):
         
         QMessageBox.information(
             self, "Success",
-            f"Module loaded successfully!\n\n"
-            f"Cold modules: {len(self.module_data.cold_modules)}\n"
-            f"Warm modules: {len(self.module_data.warm_modules)}"
+            f"Module loaded successfully!\n\n" +
+            "\n".join(f"{StyleConfig.family_label(cfg_type)} modules: {len(self.module_data.get_params_by_type(cfg_type))}"
+                      for cfg_type in families)
         )
 
     def switch_page(self, page):
         if page == self.page2:
+            self.refresh_module_tabs()
             self.populate_parameter_table()
             self.module_info_label.setText(f"Module: {self.module_data.serial_number}")
         self.stacked_widget.setCurrentWidget(page)
     
+    def configure_table_columns(self, table, families):
+        if families == self.table_families:
+            return
+        self.table_families = list(families)
+        
+        table.setColumnCount(4 + len(families))
+        table.setHorizontalHeaderLabels(
+            ["ChipID", "Config Name", "Parameter"] +
+            [f"{StyleConfig.family_icon(family)} {StyleConfig.family_label(family)} Value" for family in families] +
+            ["Status"]
+        )
+        
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        for col in range(1, 3 + len(families)):
+            header.setSectionResizeMode(col, QHeaderView.Stretch)
+        header.setSectionResizeMode(3 + len(families), QHeaderView.ResizeToContents)
+    
+    def status_column(self):
+        return 3 + len(self.table_families)
+    
     def populate_parameter_table(self):
         self.param_table.setRowCount(0)
         self.param_table.setSortingEnabled(False)
         
-        all_chips = self.module_data.get_all_chip_ids()
-        
-        all_params = set()
-        for chipID in all_chips:
-            if chipID in self.module_data.cold_modules:
-                all_params.update(self.module_data.cold_modules[chipID]['important_data'].keys())
-            if chipID in self.module_data.warm_modules:
-                all_params.update(self.module_data.warm_modules[chipID]['important_data'].keys())
+        families = self.module_data.display_families()
+        self.configure_table_columns(self.param_table, families)
+        stores = [self.module_data.get_params_by_type(family) for family in families]
         
         row = 0
-        for chipID in sorted(all_chips):
-            cold_module = self.module_data.cold_modules.get(chipID)
-            warm_module = self.module_data.warm_modules.get(chipID)
-            
-            config_name = 'N/A'
-            if cold_module:
-                config_name = cold_module.get('config_name', 'N/A')
-            elif warm_module:
-                config_name = warm_module.get('config_name', 'N/A')
+        for chipID in sorted(self.module_data.get_all_chip_ids()):
+            config_name = self.module_data.get_config_name(chipID)
             
             chip_params = set()
-            if cold_module:
-                chip_params.update(cold_module['important_data'].keys())
-            if warm_module:
-                chip_params.update(warm_module['important_data'].keys())
+            for store in stores:
+                chip_params.update(store.chip_params(chipID))
             
             for param in sorted(chip_params):
-                self.add_combined_table_row(row, chipID, config_name, param, 
-                                           cold_module, warm_module)
+                self.add_combined_table_row(row, chipID, config_name, param,
+                                            [store.get(chipID, param) for store in stores])
                 row += 1
         
         self.param_table.setSortingEnabled(True)
@@ -856,7 +4787,7 @@ class MainWindow(QMainWindow):
             f"Module: {self.module_data.serial_number} | Total parameters: {self.param_table.rowCount()}"
         )
     
-    def add_combined_table_row(self, row, chipID, config_name, param, cold_module, warm_module):
+    def add_combined_table_row(self, row, chipID, config_name, param, values):
         self.param_table.insertRow(row)
         
         chip_item = QTableWidgetItem(chipID)
@@ -874,44 +4805,70 @@ class MainWindow(QMainWindow):
         param_item.setBackground(QColor(240, 240, 240))
         self.param_table.setItem(row, 2, param_item)
         
-        if cold_module and param in cold_module['important_data']:
-            cold_value = str(cold_module['important_data'][param])
-            cold_item = QTableWidgetItem(cold_value)
-            cold_item.setBackground(StyleConfig.COLORS['cold']['val_bg'])
-            cold_item.setForeground(QColor(0, 100, 200))
-            cold_item.setFlags(cold_item.flags() & ~Qt.ItemIsEditable)
-        else:
-            cold_item = QTableWidgetItem("N/A")
-            cold_item.setBackground(QColor(220, 220, 220))
-            cold_item.setForeground(QColor(150, 150, 150))
-            cold_item.setFlags(cold_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-        self.param_table.setItem(row, 3, cold_item)
-        
-        if warm_module and param in warm_module['important_data']:
-            warm_value = str(warm_module['important_data'][param])
-            warm_item = QTableWidgetItem(warm_value)
-            warm_item.setBackground(StyleConfig.COLORS['warm']['val_bg'])
-            warm_item.setForeground(QColor(200, 50, 0))
-            warm_item.setFlags(warm_item.flags() & ~Qt.ItemIsEditable)
-        else:
-            warm_item = QTableWidgetItem("N/A")
-            warm_item.setBackground(QColor(220, 220, 220))
-            warm_item.setForeground(QColor(150, 150, 150))
-            warm_item.setFlags(warm_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-        self.param_table.setItem(row, 4, warm_item)
+        for col, (family, value) in enumerate(zip(self.table_families, values), start=3):
+            if value is not ParameterStore.MISSING:
+                colors = StyleConfig.family_colors(family)
+                value_item = QTableWidgetItem(str(value))
+                value_item.setBackground(colors['val_bg'])
+                value_item.setForeground(colors['fg'])
+                value_item.setFlags(value_item.flags() & ~Qt.ItemIsEditable)
+            else:
+                value_item = QTableWidgetItem("N/A")
+                value_item.setBackground(QColor(220, 220, 220))
+                value_item.setForeground(QColor(150, 150, 150))
+                value_item.setFlags(value_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
+            self.param_table.setItem(row, col, value_item)
         
-        status_text = ""
-        if f"{chipID}_{param}_cold" in self.module_data.modified_data:
-            status_text += "❄️"
-        if f"{chipID}_{param}_warm" in self.module_data.modified_data:
-            status_text += "🔥"
+        status_text = self.get_status_text(chipID, param)
         
         status_item = QTableWidgetItem(status_text if status_text else "—")
         status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
         status_item.setBackground(QColor(255, 255, 200) if status_text else QColor(255, 255, 255))
         status_item.setTextAlignment(Qt.AlignCenter)
-        self.param_table.setItem(row, 5, status_item)
+        self.param_table.setItem(row, self.status_column(), status_item)
 
+    def get_status_text(self, chipID, param):
+        return self.module_data.status_text(chipID, param)
+    
+    def update_table_rows(self, cells):
+        cells = set(cells)
+        for row in range(self.param_table.rowCount()):
+            chipID = self.param_table.item(row, 0).text()
+            param = self.param_table.item(row, 2).text()
+            if (chipID, param) not in cells:
+                continue
+            
+            for col, cfg_type in enumerate(self.table_families, start=3):
+                value = self.module_data.get_params_by_type(cfg_type).get(chipID, param)
+                if value is not ParameterStore.MISSING:
+                    self.param_table.item(row, col).setText(str(value))
+            
+            status_text = self.get_status_text(chipID, param)
+            status_item = self.param_table.item(row, self.status_column())
+            status_item.setText(status_text if status_text else "—")
+            status_item.setBackground(QColor(255, 255, 200) if status_text else QColor(255, 255, 255))
+    
+    def apply_external_changes(self, module_data, changes):
+        if module_data is not self.module_data:
+            return
+        
+        updated, conflicts = LiveReloader.merge(module_data, changes)
+        self.update_table_rows(updated + [(module_data.conflicts[key]['chipID'], module_data.conflicts[key]['param'])
+                                          for key in conflicts])
+        
+        reloaded = sum(1 for change in changes if change[4] is not None)
+        if reloaded:
+            self.status_label.setText(f"🔄 Reloaded {reloaded} changed chip file(s) from disk")
+        
+        if conflicts:
+            lines = ["Chip files changed on disk while these parameters had unsaved edits.",
+                     "Local values were kept:\n"]
+            for key in conflicts:
+                conflict = module_data.conflicts[key]
+                lines.append(f"⚠️ {conflict['type'].upper()} - ChipID {conflict['chipID']}: {conflict['param']} "
+                             f"local = {conflict['local']}, on disk = {conflict['external']}")
+            QMessageBox.warning(self, "External Changes", "\n".join(lines))
+    
     def edit_parameter(self):
         row = self.param_table.currentRow()
         col = self.param_table.currentColumn()
@@ -920,12 +4877,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a parameter to edit")
             return
         
-        if col not in [3, 4]:
-            QMessageBox.warning(self, "Warning", "Please click on a Cold or Warm value cell to edit")
+        if not 3 <= col < self.status_column():
+            QMessageBox.warning(self, "Warning", "Please click on a configuration value cell to edit")
             return
         
-        is_cold = (col == 3)
-        cfg_type = "cold" if is_cold else "warm"
+        cfg_type = self.table_families[col - 3]
         
         cell_item = self.param_table.item(row, col)
         if cell_item.text() == "N/A":
@@ -935,7 +4891,7 @@ class MainWindow(QMainWindow):
             )
             return
         
-        param_info = self.extract_parameter_info_from_combined_row(row, is_cold)
+        param_info = self.extract_parameter_info_from_combined_row(row, col)
         
         dialog = EditParameterDialog(self, param_info)
         
@@ -952,12 +4908,11 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Error: {str(e)}")
     
-    def extract_parameter_info_from_combined_row(self, row, is_cold):
+    def extract_parameter_info_from_combined_row(self, row, col):
         chipID = self.param_table.item(row, 0).text()
         config_name = self.param_table.item(row, 1).text()
         param = self.param_table.item(row, 2).text()
         
-        col = 3 if is_cold else 4
         current_value = self.param_table.item(row, col).text()
         
         return {
@@ -965,37 +4920,29 @@ class MainWindow(QMainWindow):
             'config_name': config_name,
             'param': param,
             'current_value': current_value,
-            'is_cold': is_cold
+            'type': self.table_families[col - 3]
         }
     
     def apply_parameter_change_combined(self, row, col, param_info, new_value):
         self.param_table.item(row, col).setText(str(new_value))
         
-        cfg_type = "cold" if param_info['is_cold'] else "warm"
-        modules = self.module_data.get_module_by_type(cfg_type)
+        cfg_type = param_info['type']
+        store = self.module_data.get_params_by_type(cfg_type)
         chipID = param_info['chipID']
         
-        if chipID in modules:
-            modules[chipID]['important_data'][param_info['param']] = new_value
+        if chipID in store:
+            store.set(chipID, param_info['param'], new_value)
             
-            key = f"{chipID}_{param_info['param']}_{cfg_type}"
-            self.module_data.modified_data[key] = {
-                'chipID': chipID,
-                'param': param_info['param'],
-                'value': new_value,
-                'type': cfg_type,
-                'config_name': param_info['config_name']
-            }
+            self.module_data.record_modification(
+                chipID, param_info['param'], new_value, cfg_type, param_info['config_name']
+            )
             
-            status_text = ""
-            if f"{chipID}_{param_info['param']}_cold" in self.module_data.modified_data:
-                status_text += "❄️"
-            if f"{chipID}_{param_info['param']}_warm" in self.module_data.modified_data:
-                status_text += "🔥"
+            status_text = self.get_status_text(chipID, param_info['param'])
             
-            status_item = self.param_table.item(row, 5)
+            status_item = self.param_table.item(row, self.status_column())
             status_item.setText(status_text if status_text else "—")
             status_item.setBackground(QColor(255, 255, 200) if status_text else QColor(255, 255, 255))
+            self.refresh_module_tabs()
             
             QMessageBox.information(
                 self, "Success",
@@ -1010,62 +4957,171 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Error", "Module data not found")
 
+    def open_pixel_masks(self):
+        if not self.module_data.get_all_chip_ids():
+            QMessageBox.warning(self, "Warning", "No module loaded")
+            return
+        
+        dialog = PixelMaskDialog(self, self.module_data)
+        dialog.exec_()
+        self.populate_parameter_table()
+
+    def modules_to_save(self):
+        modules = self.workspace.dirty_modules()
+        if self.module_data.has_edits() and self.module_data not in modules:
+            modules.insert(0, self.module_data)
+        return modules
+    
     def save_all_changes(self):
-        if not self.module_data.modified_data:
+        modules = self.modules_to_save()
+        if not modules:
             QMessageBox.information(self, "Info", "No changes to save")
             return
         
-        summary = self.build_save_summary()
+        violations = self.register_schema.validate_fleet(modules)
+        if violations:
+            reply = QMessageBox.question(
+                self, "Register Check",
+                "\n".join(RegisterSchema.format_report(violations, limit=10)) + "\n\nSave anyway?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+        
+        summary = self.build_save_summary(modules)
         
         reply = QMessageBox.question(
             self, "Confirm Save", summary,
             QMessageBox.Yes | QMessageBox.No
         )
         
-        if reply == QMessageBox.Yes:
+        if reply != QMessageBox.Yes:
+            return
+        
+        compression = "gz" if self.check_compress.isChecked() else None
+        saved = []
+        failed = []
+        for module_data in modules:
             try:
-                saved_path = FileSaver.save_changes(self.module_data)
-                cold_cnt, warm_cnt = self.count_modifications()
-                
-                QMessageBox.information(
-                    self, "Success",
-                    f"All changes saved successfully!\n\n"
-                    f"Files saved to:\n{saved_path}\n\n"
-                    f"Cold modifications: {cold_cnt}\n"
-                    f"Warm modifications: {warm_cnt}"
-                )
+                saved_path = FileSaver.save_changes(module_data, compression=compression)
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save files:\n{str(e)}")
-    
-    def build_save_summary(self):
-        cold_cnt, warm_cnt = self.count_modifications()
+                failed.append(f"{module_data.serial_number}: {str(e)}")
+                continue
+            counts = self.count_modifications(module_data)
+            saved.append(f"Files saved to:\n{saved_path}\n\n" +
+                         "\n".join(f"{StyleConfig.family_label(cfg_type)} modifications: {count}"
+                                   for cfg_type, count in counts.items()))
+        self.refresh_module_tabs()
+        if self.stacked_widget.currentWidget() is self.page2:
+            self.populate_parameter_table()
         
+        if saved:
+            QMessageBox.information(self, "Success", "All changes saved successfully!\n\n" + "\n\n".join(saved))
+        if failed:
+            QMessageBox.critical(self, "Error", "Failed to save files:\n" + "\n".join(failed))
+    
+    def build_save_summary(self, modules=None):
+        modules = modules or [self.module_data]
         lines = ["The following changes will be saved:\n"]
         
-        for key, mod in self.module_data.modified_data.items():
-            if mod['type'] == 'cold':
-                lines.append(f"❄️ COLD - ChipID {mod['chipID']}: {mod['param']} = {mod['value']}")
-            else:
-                lines.append(f"🔥 WARM - ChipID {mod['chipID']}: {mod['param']} = {mod['value']}")
-        
-        lines.append(f"\nTotal: {cold_cnt} cold + {warm_cnt} warm = {len(self.module_data.modified_data)} modifications")
+        for module_data in modules:
+            if len(modules) > 1:
+                lines.append(f"📦 Module {module_data.serial_number}:")
+            for key, mod in module_data.modified_data.items():
+                lines.append(f"{StyleConfig.family_icon(mod['type'])} {mod['type'].upper()} - "
+                             f"ChipID {mod['chipID']}: {mod['param']} = {mod['value']}")
+            for key, edit in module_data.pixel_edits.items():
+                lines.append(f"{StyleConfig.family_icon(edit['type'])} {edit['type'].upper()} - "
+                             f"ChipID {edit['chipID']}: PixelConfig {ModuleData.describe_pixel_edit(edit)}")
+            
+            counts = self.count_modifications(module_data)
+            totals = " + ".join(f"{count} {cfg_type}" for cfg_type, count in counts.items())
+            lines.append(f"\nTotal: {totals} = {len(module_data.modified_data)} modifications")
+            if len(modules) > 1:
+                lines.append("")
         
         return "\n".join(lines)
     
-    def count_modifications(self):
-        cold_cnt = sum(1 for mod in self.module_data.modified_data.values() if mod['type'] == 'cold')
-        warm_cnt = sum(1 for mod in self.module_data.modified_data.values() if mod['type'] == 'warm')
-        return cold_cnt, warm_cnt
+    def count_modifications(self, module_data=None):
+        module_data = module_data or self.module_data
+        counts = {cfg_type: 0 for cfg_type in module_data.families if cfg_type in ModuleData.REQUIRED_FAMILIES}
+        for mod in module_data.modified_data.values():
+            counts[mod['type']] = counts.get(mod['type'], 0) + 1
+        return counts
 
+    def open_fleet_statistics(self, rebuild=False):
+        base_directory = self.base_directory
+        if not os.path.isdir(base_directory):
+            base_directory = QFileDialog.getExistingDirectory(self, "Select Modules Directory")
+            if not base_directory:
+                return
+            self.base_directory = base_directory
+        
+        start = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.fleet_cache = FleetStatistics.load(base_directory, rebuild=rebuild)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Error", f"Failed to build fleet statistics:\n{str(e)}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        self.stats_info_label.setText(
+            f"{len(set(self.fleet_cache.rows['module']))} modules, {len(self.fleet_cache)} chips "
+            f"({time.perf_counter() - start:.2f}s)"
+        )
+        self.show_fleet_statistics(self.combo_stats_param.currentText())
+        self.stacked_widget.setCurrentWidget(self.page_stats)
+    
+    def show_fleet_statistics(self, param):
+        if getattr(self, 'fleet_cache', None) is None:
+            return
+        self.stats_text.setText("\n".join(FleetStatistics.report(self.fleet_cache, [param])))
+    
     def go_to_summary(self):
-        summary_text = SummaryBuilder.build_summary(self.module_data)
-        self.summary_text.setText(summary_text)
+        self.summary_lines = list(SummaryBuilder.iter_summary(self.module_data, self.summary_cache))
+        self.show_summary_page(0)
         self.stacked_widget.setCurrentWidget(self.page3)
     
+    def show_summary_page(self, page):
+        pages = max(1, math.ceil(len(self.summary_lines) / self.SUMMARY_PAGE_LINES))
+        self.summary_page = max(0, min(page, pages - 1))
+        start = self.summary_page * self.SUMMARY_PAGE_LINES
+        
+        self.summary_text.setPlainText("\n".join(self.summary_lines[start:start + self.SUMMARY_PAGE_LINES]))
+        self.summary_page_label.setText(f"Page {self.summary_page + 1} / {pages}")
+        self.button_summary_prev.setEnabled(self.summary_page > 0)
+        self.button_summary_next.setEnabled(self.summary_page < pages - 1)
+    
+    def export_summary(self):
+        default_name = f"{self.module_data.serial_number}_summary.txt"
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Summary", default_name,
+            "Text (*.txt);;CSV (*.csv);;JSON (*.json)"
+        )
+        if not path:
+            return
+        
+        try:
+            count = SummaryBuilder.export(self.module_data, path, cache=self.summary_cache)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", f"Error exporting summary:\n{str(e)}")
+            return
+        QMessageBox.information(self, "Success", f"Summary exported to:\n{path}\n\n{count} entries written")
+    
+    def describe_unsaved_modules(self):
+        modules = self.workspace.dirty_modules()
+        if not modules:
+            return ""
+        return "\n\nUnsaved changes in:\n" + "\n".join(
+            f"  • {module_data.serial_number}: {len(module_data.unsaved)} modification(s)" for module_data in modules
+        )
+    
     def finish_and_reset(self):
         reply = QMessageBox.question(
             self, "Finish",
-            "Return to start screen?\n\nAll unsaved changes will be lost.",
+            "Return to start screen?\n\nAll unsaved changes will be lost." + self.describe_unsaved_modules(),
             QMessageBox.Yes | QMessageBox.No
         )
         
@@ -1073,7 +5129,13 @@ class MainWindow(QMainWindow):
             self.reset_application()
     
     def reset_application(self):
+        SessionSnapshot.discard()
+        self.module_watcher.stop()
+        self.workspace_loader.cancel()
+        self.workspace.clear()
         self.module_data.clear()
+        self.refresh_module_tabs()
+        self.summary_cache.clear()
         
         self.edit_line_path.clear()
         self.info_text.setText(
@@ -1089,9 +5151,259 @@ class MainWindow(QMainWindow):
         
         self.stacked_widget.setCurrentWidget(self.page1)
         QMessageBox.information(self, "Reset", "Application reset successfully")
+    
+    def closeEvent(self, event):
+        unsaved = self.describe_unsaved_modules()
+        if unsaved:
+            reply = QMessageBox.question(
+                self, "Quit",
+                "Quit the application?" + unsaved + "\n\nThey are kept in the session snapshot "
+                "and offered for restore on the next start.",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+        
+        self.session_timer.stop()
+        self.serial_timer.stop()
+        self.folder_search.shutdown(wait=False, cancel_futures=True)
+        self.save_session()
+        self.speculative_loader.shutdown()
+        self.workspace_loader.shutdown()
+        self.module_watcher.shutdown()
+        super().closeEvent(event)
+
+
+def _iter_chip_files(paths, match):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, _, files in os.walk(path):
+            if not os.path.basename(root).startswith('L2_'):
+                continue
+            for f in sorted(files):
+                if match(f):
+                    yield os.path.join(root, f)
+
+
+def _command_to_binary(args):
+    for json_path in _iter_chip_files(args.paths, ConfigIO.is_json_name):
+        print(f"{json_path} -> {BinaryConfig.convert_json(json_path)}")
+    return 0
+
+
+def _command_to_json(args):
+    for bin_path in _iter_chip_files(args.paths, lambda f: f.endswith(BinaryConfig.EXTENSION)):
+        json_path = bin_path[:-len(BinaryConfig.EXTENSION)] + ".json"
+        if os.path.exists(json_path) and not args.force:
+            print(f"Skipping {bin_path}: {json_path} exists (use --force to overwrite)")
+            continue
+        try:
+            print(f"{bin_path} -> {BinaryConfig.export_json(bin_path, json_path)}")
+        except (OSError, ValueError) as e:
+            print(f"Skipping {bin_path}: {str(e)}")
+    return 0
+
+
+def _load_module(path, module_data=None):
+    module_data = module_data or ModuleData()
+    module_data.serial_number = os.path.basename(os.path.normpath(path))
+    module_data.base_module_path = path
+    loaded = ConfigLoader.load_families(path, module_data)
+    return module_data if any(loaded.values()) else None
+
+
+def _command_validate(args):
+    pool = ContentPool()
+    modules = []
+    for path in args.paths:
+        module_data = _load_module(path, ModuleData(pool))
+        if module_data is None:
+            print(f"Skipping {path}: no configurations found")
+            continue
+        modules.append(module_data)
+    
+    violations = RegisterSchema().validate_fleet(modules)
+    print("\n".join(RegisterSchema.format_report(violations, limit=args.limit)))
+    return 1 if violations else 0
+
+
+def _command_verify(args):
+    pairs = RoundTripVerifier.find_pairs(args.paths)
+    if not pairs:
+        print("No _modified folders found")
+        return 1
+    results = RoundTripVerifier.verify(pairs, workers=args.jobs)
+    print("\n".join(RoundTripVerifier.format_report(results)))
+    return 1 if any(issues for _, _, issues in results) else 0
+
+
+def _command_connectivity(args):
+    start = time.perf_counter()
+    results = ConnectivityIndex.check_fleet(args.paths, workers=args.jobs)
+    if not results:
+        print("No module folders found")
+        return 1
+    print("\n".join(ConnectivityIndex.format_fleet_report(results, limit=args.limit)))
+    print(f"⏱️ Checked in {time.perf_counter() - start:.2f}s")
+    return 1 if any(issues for _, _, issues in results) else 0
+
+
+def _command_export(args):
+    serials = list(args.serials)
+    if args.from_file:
+        with open(args.from_file) as f:
+            serials += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    
+    paths, missing, ambiguous = FleetExporter.resolve_serials(args.base_directory, serials)
+    for serial in missing:
+        print(f"Module folder not found for serial: {serial}")
+    for serial, matches in ambiguous.items():
+        print(f"Serial {serial} matches several module folders ({', '.join(matches)}); give the full serial")
+    if not paths:
+        return 1
+    
+    start = time.perf_counter()
+    counts = FleetExporter.export(paths, args.connectivity, args.table, args.param, workers=args.jobs)
+    print(f"Exported {counts['modules']} module(s): {counts['links']} port links -> {args.connectivity}, "
+          f"{counts['rows']} chip rows -> {args.table}")
+    if counts['issues']:
+        print(f"⚠️ {counts['issues']} connectivity issue(s) recorded in {args.connectivity}")
+    print(f"⏱️ {time.perf_counter() - start:.2f}s")
+    return 1 if missing or ambiguous or counts['failed'] else 0
+
+
+def _command_stats(args):
+    start = time.perf_counter()
+    cache = FleetStatistics.load(args.base_directory, rebuild=args.rebuild, workers=args.jobs)
+    print("\n".join(FleetStatistics.report(cache, args.param or None, bins=args.bins)))
+    print(f"⏱️ {len(cache)} chip configurations in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+def _command_bench_codec(args):
+    paths = list(_iter_chip_files(args.paths, ConfigIO.is_json_name))
+    if not paths:
+        print("No JSON configuration files found")
+        return 1
+    
+    results = JsonCodec.benchmark(paths, repeat=args.repeat)
+    print(f"Benchmarked {len(paths)} files, {args.repeat} runs each (active backend: {JsonCodec.backend})")
+    for operation in ['load', 'dump']:
+        baseline = results[f"{operation}:stdlib"][0]
+        for key, (elapsed, identical) in results.items():
+            if not key.startswith(operation + ":"):
+                continue
+            check = "identical" if identical else "MISMATCH"
+            print(f"  {key:<14} {elapsed * 1000:9.1f} ms  x{baseline / elapsed:5.2f}  {check}")
+    return 0 if all(identical for _, identical in results.values()) else 1
+
+
+def _command_serve(args):
+    service = ConfigService(capacity=args.capacity)
+    print(f"Serving module configurations on {args.address}")
+    try:
+        asyncio.run(service.serve(args.address))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _command_query(args):
+    fields = dict(field.split("=", 1) for field in args.fields)
+    client = ConfigClient(args.address)
+    try:
+        response = client.request(args.op, **fields)
+    except RuntimeError as e:
+        print(f"Error: {str(e)}")
+        return 1
+    finally:
+        client.close()
+    
+    response.pop('ok', None)
+    if 'summary' in response:
+        print(response['summary'])
+    else:
+        print(json.dumps(response, indent=4))
+    return 0
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="ATLAS Module Configuration GUI")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    to_binary = subparsers.add_parser('to-binary', help="Write binary containers next to chip JSON files")
+    to_binary.add_argument('paths', nargs='+', help="Chip JSON files or module folders")
+    to_binary.set_defaults(func=_command_to_binary)
+    
+    to_json = subparsers.add_parser('to-json', help="Export binary containers back to JSON")
+    to_json.add_argument('paths', nargs='+', help="Binary container files or module folders")
+    to_json.add_argument('--force', action='store_true', help="Overwrite existing JSON files")
+    to_json.set_defaults(func=_command_to_json)
+    
+    validate = subparsers.add_parser('validate', help="Check register values of module folders against the schema")
+    validate.add_argument('paths', nargs='+', help="Module folders")
+    validate.add_argument('--limit', type=int, default=50, help="Maximum number of violations to list")
+    validate.set_defaults(func=_command_validate)
+    
+    verify = subparsers.add_parser('verify', help="Check _modified folders against their originals and edit journals")
+    verify.add_argument('paths', nargs='+', help="Module folders, _modified folders or folders containing them")
+    verify.add_argument('--jobs', type=int, default=None, help="Number of worker processes")
+    verify.set_defaults(func=_command_verify)
+    
+    connectivity = subparsers.add_parser('connectivity', help="Check YarrPort mappings of module folders for consistency")
+    connectivity.add_argument('paths', nargs='+', help="Module folders or folders containing them")
+    connectivity.add_argument('--limit', type=int, default=20, help="Maximum number of issues to list per module")
+    connectivity.add_argument('--jobs', type=int, default=None, help="Number of worker processes")
+    connectivity.set_defaults(func=_command_connectivity)
+    
+    export = subparsers.add_parser('export', help="Export port mappings and parameters of many modules in one pass")
+    export.add_argument('serials', nargs='*', help="Module serial numbers or folders")
+    export.add_argument('--from-file', help="File with one serial number per line")
+    export.add_argument('--base-directory', default=".", help="Folder containing the module folders")
+    export.add_argument('--connectivity', default="connectivity.json", help="Combined connectivity file (.json or .json.gz)")
+    export.add_argument('--table', default="parameters.csv", help="Parameter table (.csv or .csv.gz)")
+    export.add_argument('--param', action='append', help="Parameter to export (repeatable, default: the table parameters)")
+    export.add_argument('--jobs', type=int, default=None, help="Number of worker processes")
+    export.set_defaults(func=_command_export)
+    
+    stats = subparsers.add_parser('stats', help="Aggregate parameter distributions over all module folders")
+    stats.add_argument('base_directory', help="Folder containing the module folders")
+    stats.add_argument('--param', action='append', choices=FleetStatistics.PARAMS,
+                       help="Parameter to report (repeatable, default: all)")
+    stats.add_argument('--bins', type=int, default=20, help="Number of histogram bins")
+    stats.add_argument('--rebuild', action='store_true', help="Ignore the cached columns")
+    stats.add_argument('--jobs', type=int, default=None, help="Number of worker processes")
+    stats.set_defaults(func=_command_stats)
+    
+    bench = subparsers.add_parser('bench-codec', help="Compare JSON parsers and the indent=4 writer")
+    bench.add_argument('paths', nargs='+', help="Chip files or module folders")
+    bench.add_argument('--repeat', type=int, default=3, help="Runs per file")
+    bench.set_defaults(func=_command_bench_codec)
+    
+    serve = subparsers.add_parser('serve', help="Run the resident configuration service")
+    serve.add_argument('--address', default=ConfigService.DEFAULT_ADDRESS,
+                       help="host:port or unix:/path/to/socket")
+    serve.add_argument('--capacity', type=int, default=8, help="Number of modules kept parsed")
+    serve.set_defaults(func=_command_serve)
+    
+    query = subparsers.add_parser('query', help="Send a request to the configuration service")
+    query.add_argument('op', help="ping, modules, get, ports, connectivity, set, validate, summary, save or evict")
+    query.add_argument('fields', nargs='*', help="Request fields as key=value (e.g. path=... param=SldoTrimA)")
+    query.add_argument('--address', default=ConfigService.DEFAULT_ADDRESS,
+                       help="host:port or unix:/path/to/socket")
+    query.set_defaults(func=_command_query)
+    
+    return parser
 
 
 def main():
+    args = build_arg_parser().parse_args()
+    if args.command:
+        sys.exit(args.func(args))
+    
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = MainWindow()